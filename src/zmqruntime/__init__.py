@@ -1,49 +1,107 @@
-"""Public API for zmqruntime."""
+"""Public API for zmqruntime.
+
+Names are resolved lazily (PEP 562) so that ``import zmqruntime`` stays cheap
+and only the submodules a caller actually touches get imported.
+"""
 from __future__ import annotations
 
-from zmqruntime.ack_listener import GlobalAckListener
-from zmqruntime.client import ZMQClient
-from zmqruntime.config import TransportMode, ZMQConfig
-from zmqruntime.messages import (
-    CancelRequest,
-    ControlMessageType,
-    ExecuteRequest,
-    ExecuteResponse,
-    ExecutionStatus,
-    ImageAck,
-    MessageFields,
-    PongResponse,
-    ProgressUpdate,
-    ResponseType,
-    ROIMessage,
-    ShapesMessage,
-    SocketType,
-    StatusRequest,
-)
-from zmqruntime.queue_tracker import QueueTracker, GlobalQueueTrackerRegistry
-from zmqruntime.server import ZMQServer
-from zmqruntime.transport import (
-    coerce_transport_mode,
-    get_control_port,
-    get_control_url,
-    get_default_transport_mode,
-    get_ipc_socket_path,
-    get_zmq_transport_url,
-    is_port_in_use,
-    ping_control_port,
-    remove_ipc_socket,
-    wait_for_server_ready,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zmqruntime.ack_listener import GlobalAckListener
+    from zmqruntime.client import MPProcessHandle, PopenHandle, ServerHandle, ZMQClient
+    from zmqruntime.config import TransportMode, ZMQConfig
+    from zmqruntime.messages import (
+        CancelRequest,
+        ControlMessageType,
+        ExecuteRequest,
+        ExecuteResponse,
+        ExecutionRecord,
+        ExecutionStatus,
+        ImageAck,
+        MessageFields,
+        PongResponse,
+        ProgressUpdate,
+        ResponseType,
+        ROIMessage,
+        ShapesMessage,
+        SocketType,
+        ViewerType,
+        StatusRequest,
+    )
+    from zmqruntime.queue_tracker import (
+        GLOBAL_QUEUE_TRACKER_REGISTRY,
+        GlobalQueueTrackerRegistry,
+        QueueTracker,
+    )
+    from zmqruntime.server import ZMQServer
+    from zmqruntime.transport import (
+        coerce_transport_mode,
+        get_control_port,
+        get_control_url,
+        get_default_transport_mode,
+        get_ipc_socket_path,
+        get_zmq_transport_url,
+        is_port_in_use,
+        ping_control_port,
+        remove_ipc_socket,
+        wait_for_server_ready,
+    )
+
+_LAZY_ATTRS = {
+    "GlobalAckListener": "zmqruntime.ack_listener",
+    "MPProcessHandle": "zmqruntime.client",
+    "PopenHandle": "zmqruntime.client",
+    "ServerHandle": "zmqruntime.client",
+    "ZMQClient": "zmqruntime.client",
+    "TransportMode": "zmqruntime.config",
+    "ZMQConfig": "zmqruntime.config",
+    "CancelRequest": "zmqruntime.messages",
+    "ControlMessageType": "zmqruntime.messages",
+    "ExecuteRequest": "zmqruntime.messages",
+    "ExecuteResponse": "zmqruntime.messages",
+    "ExecutionRecord": "zmqruntime.messages",
+    "ExecutionStatus": "zmqruntime.messages",
+    "ImageAck": "zmqruntime.messages",
+    "MessageFields": "zmqruntime.messages",
+    "PongResponse": "zmqruntime.messages",
+    "ProgressUpdate": "zmqruntime.messages",
+    "ResponseType": "zmqruntime.messages",
+    "ROIMessage": "zmqruntime.messages",
+    "ShapesMessage": "zmqruntime.messages",
+    "SocketType": "zmqruntime.messages",
+    "ViewerType": "zmqruntime.messages",
+    "StatusRequest": "zmqruntime.messages",
+    "QueueTracker": "zmqruntime.queue_tracker",
+    "GlobalQueueTrackerRegistry": "zmqruntime.queue_tracker",
+    "GLOBAL_QUEUE_TRACKER_REGISTRY": "zmqruntime.queue_tracker",
+    "ZMQServer": "zmqruntime.server",
+    "coerce_transport_mode": "zmqruntime.transport",
+    "get_control_port": "zmqruntime.transport",
+    "get_control_url": "zmqruntime.transport",
+    "get_default_transport_mode": "zmqruntime.transport",
+    "get_ipc_socket_path": "zmqruntime.transport",
+    "get_zmq_transport_url": "zmqruntime.transport",
+    "is_port_in_use": "zmqruntime.transport",
+    "ping_control_port": "zmqruntime.transport",
+    "remove_ipc_socket": "zmqruntime.transport",
+    "wait_for_server_ready": "zmqruntime.transport",
+}
 
 __all__ = [
     "GlobalAckListener",
     "ZMQClient",
+    "ServerHandle",
+    "MPProcessHandle",
+    "PopenHandle",
     "TransportMode",
     "ZMQConfig",
     "CancelRequest",
     "ControlMessageType",
     "ExecuteRequest",
     "ExecuteResponse",
+    "ExecutionRecord",
     "ExecutionStatus",
     "ImageAck",
     "MessageFields",
@@ -53,9 +111,11 @@ __all__ = [
     "ROIMessage",
     "ShapesMessage",
     "SocketType",
+    "ViewerType",
     "StatusRequest",
     "QueueTracker",
     "GlobalQueueTrackerRegistry",
+    "GLOBAL_QUEUE_TRACKER_REGISTRY",
     "ZMQServer",
     "coerce_transport_mode",
     "get_control_port",
@@ -68,3 +128,16 @@ __all__ = [
     "remove_ipc_socket",
     "wait_for_server_ready",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
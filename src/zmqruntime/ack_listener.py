@@ -8,9 +8,10 @@ from typing import Callable, Optional
 
 import zmq
 
+from zmqruntime.codec import decode_data
 from zmqruntime.config import TransportMode, ZMQConfig
 from zmqruntime.messages import ImageAck
-from zmqruntime.queue_tracker import GlobalQueueTrackerRegistry
+from zmqruntime.queue_tracker import GLOBAL_QUEUE_TRACKER_REGISTRY
 from zmqruntime.transport import get_default_transport_mode, get_zmq_transport_url
 
 logger = logging.getLogger(__name__)
@@ -23,28 +24,34 @@ class GlobalAckListener:
     _lock = threading.Lock()
 
     def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+        # Only the first construction takes the lock; later calls are a plain read
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
-        self._callbacks: list[Callable[[ImageAck], None]] = []
-        self._running = False
-        self._thread: Optional[threading.Thread] = None
-        self._transport_mode: TransportMode | None = None
-        self._config: ZMQConfig | None = None
-        self._port: int | None = None
-        self._host: str = "*"
-        self._initialized = True
-        self._register_default_callback()
+        with self._lock:
+            if self._initialized:
+                return
+            self._callbacks: list[Callable[[ImageAck], None]] = []
+            self._running = False
+            self._thread: Optional[threading.Thread] = None
+            self._transport_mode: TransportMode | None = None
+            self._config: ZMQConfig | None = None
+            self._port: int | None = None
+            self._host: str = "*"
+            self._register_default_callback()
+            self._initialized = True
 
     def _register_default_callback(self) -> None:
         def _mark_processed(ack: ImageAck) -> None:
-            tracker = GlobalQueueTrackerRegistry().get_tracker(ack.viewer_port)
+            tracker = GLOBAL_QUEUE_TRACKER_REGISTRY.get_tracker(ack.viewer_port)
             if tracker:
                 tracker.mark_processed(ack.image_id)
 
@@ -85,6 +92,18 @@ class GlobalAckListener:
                 return
             self._running = False
 
+    def _dispatch_ack(self, message) -> None:
+        try:
+            ack = ImageAck.from_dict(decode_data(message))
+        except Exception as e:
+            logger.error("Failed to parse ack message: %s", e, exc_info=True)
+            return
+        for callback in list(self._callbacks):
+            try:
+                callback(ack)
+            except Exception as e:
+                logger.error("Ack callback error: %s", e, exc_info=True)
+
     def _listener_loop(self) -> None:
         context = zmq.Context()
         socket = None
@@ -101,20 +120,22 @@ class GlobalAckListener:
             socket.bind(ack_url)
             logger.info("Ack listener bound to %s", ack_url)
 
+            # A blocking recv bounded by RCVTIMEO (milliseconds) replaces polling
+            # the single PULL socket; zmq.Again is just the idle tick.
+            socket.setsockopt(zmq.RCVTIMEO, self._config.ack_poll_interval_ms)
             while self._running:
                 try:
-                    if socket.poll(timeout=1000):
-                        ack_dict = socket.recv_json()
+                    try:
+                        message = socket.recv(copy=False).buffer
+                    except zmq.Again:
+                        continue
+                    # Drain every queued ack per wakeup instead of one per tick
+                    while message is not None:
+                        self._dispatch_ack(message)
                         try:
-                            ack = ImageAck.from_dict(ack_dict)
-                        except Exception as e:
-                            logger.error("Failed to parse ack message: %s", e, exc_info=True)
-                            continue
-                        for callback in list(self._callbacks):
-                            try:
-                                callback(ack)
-                            except Exception as e:
-                                logger.error("Ack callback error: %s", e, exc_info=True)
+                            message = socket.recv(zmq.NOBLOCK, copy=False).buffer
+                        except zmq.Again:
+                            message = None
                 except zmq.ZMQError as e:
                     if self._running:
                         logger.error("ZMQ error in ack listener: %s", e)
@@ -1,17 +1,20 @@
 """ZMQ client base class."""
 from __future__ import annotations
 
-import pickle
+import os
 import platform
 import socket
 import subprocess
 import threading
 import time
+import uuid
 from abc import ABC, abstractmethod
 
 import zmq
 
+from zmqruntime.codec import decode_control, encode_control_request
 from zmqruntime.config import TransportMode, ZMQConfig
+from zmqruntime.messages import ControlMessageType, MessageFields, ResponseType
 from zmqruntime.transport import (
     get_default_transport_mode,
     get_ipc_socket_path,
@@ -21,6 +24,75 @@ from zmqruntime.transport import (
     wait_for_server_ready,
 )
 
+# Control messages with no per-call fields, encoded once at import time.
+_PING_BYTES = encode_control_request({MessageFields.TYPE: ControlMessageType.PING.value})
+_STATUS_BYTES = encode_control_request({MessageFields.TYPE: ControlMessageType.STATUS.value})
+_SHUTDOWN_BYTES = encode_control_request({MessageFields.TYPE: ControlMessageType.SHUTDOWN.value})
+_FORCE_SHUTDOWN_BYTES = encode_control_request({MessageFields.TYPE: ControlMessageType.FORCE_SHUTDOWN.value})
+
+
+class ServerHandle(ABC):
+    """Uniform lifecycle interface over a spawned server process."""
+
+    def __init__(self, process):
+        self.process = process
+
+    @abstractmethod
+    def alive(self) -> bool:
+        pass
+
+    def terminate(self):
+        self.process.terminate()
+
+    def kill(self):
+        self.process.kill()
+
+    @abstractmethod
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the process to exit; returns False on timeout."""
+
+    def stop(self, timeout: float = 5.0):
+        """Terminate, escalating to kill if the process outlives timeout."""
+        if not self.alive():
+            return
+        self.terminate()
+        if not self.wait(timeout):
+            self.kill()
+
+
+class MPProcessHandle(ServerHandle):
+    """ServerHandle for a multiprocessing.Process."""
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.process.join(timeout=timeout)
+        return not self.process.is_alive()
+
+
+class PopenHandle(ServerHandle):
+    """ServerHandle for a subprocess.Popen."""
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def wait(self, timeout: float | None = None) -> bool:
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+
+def wrap_server_process(process) -> ServerHandle | None:
+    """Adapt whatever _spawn_server_process returned to a ServerHandle."""
+    if process is None or isinstance(process, ServerHandle):
+        return process
+    if isinstance(process, subprocess.Popen):
+        return PopenHandle(process)
+    return MPProcessHandle(process)
+
 
 class ZMQClient(ABC):
     """ABC for ZMQ clients - dual-channel pattern with auto-spawning."""
@@ -39,6 +111,23 @@ class ZMQClient(ABC):
         self.control_port = port + self.config.control_port_offset
         self.persistent = persistent
         self.transport_mode = transport_mode or get_default_transport_mode()
+        self._data_url = get_zmq_transport_url(
+            self.port,
+            host=self.host,
+            mode=self.transport_mode,
+            config=self.config,
+        )
+        self._control_url = get_zmq_transport_url(
+            self.control_port,
+            host=self.host,
+            mode=self.transport_mode,
+            config=self.config,
+        )
+        self._ipc_socket_path = (
+            get_ipc_socket_path(self.port, self.config)
+            if self.transport_mode == TransportMode.IPC
+            else None
+        )
         self.zmq_context = None
         self.data_socket = None
         self.control_socket = None
@@ -46,6 +135,7 @@ class ZMQClient(ABC):
         self._connected = False
         self._connected_to_existing = False
         self._lock = threading.Lock()
+        self._ctrl_lock = threading.Lock()
 
     def connect(self, timeout: float = 10.0):
         with self._lock:
@@ -53,12 +143,13 @@ class ZMQClient(ABC):
                 return True
             if self._is_port_in_use(self.port):
                 if self._try_connect_to_existing(self.port):
+                    self._setup_client_sockets()
                     self._connected = self._connected_to_existing = True
                     return True
                 self._kill_processes_on_port(self.port)
                 self._kill_processes_on_port(self.control_port)
                 time.sleep(0.5)
-            self.server_process = self._spawn_server_process()
+            self.server_process = wrap_server_process(self._spawn_server_process())
             if not self._wait_for_server_ready(timeout):
                 return False
             self._setup_client_sockets()
@@ -71,54 +162,128 @@ class ZMQClient(ABC):
                 return
             self._cleanup_sockets()
             if not self._connected_to_existing and self.server_process and not self.persistent:
-                if hasattr(self.server_process, "is_alive"):
-                    if self.server_process.is_alive():
-                        self.server_process.terminate()
-                        self.server_process.join(timeout=5)
-                        if self.server_process.is_alive():
-                            self.server_process.kill()
-                else:
-                    if self.server_process.poll() is None:
-                        self.server_process.terminate()
-                        try:
-                            self.server_process.wait(timeout=5)
-                        except subprocess.TimeoutExpired:
-                            self.server_process.kill()
+                self.server_process.stop(timeout=5)
             self._connected = False
 
     def is_connected(self):
         return self._connected
 
-    def _setup_client_sockets(self):
-        import zmq
+    def _ensure_context(self):
+        if self.zmq_context is None:
+            self.zmq_context = zmq.Context()
+        return self.zmq_context
 
-        self.zmq_context = zmq.Context()
-        data_url = get_zmq_transport_url(
-            self.port,
-            host=self.host,
-            mode=self.transport_mode,
-            config=self.config,
-        )
+    def _setup_client_sockets(self):
+        self._ensure_context()
 
         self.data_socket = self.zmq_context.socket(zmq.SUB)
         self.data_socket.setsockopt(zmq.LINGER, 0)
-        self.data_socket.connect(data_url)
+        self._apply_tcp_options(self.data_socket)
+        self.data_socket.connect(self._data_url)
         self.data_socket.setsockopt(zmq.SUBSCRIBE, b"")
-        time.sleep(0.1)
+        with self._ctrl_lock:
+            if self.control_socket is None:
+                self.control_socket = self._create_control_socket()
+        self._await_subscription()
+
+    def _await_subscription(self, timeout: float = 1.0) -> bool:
+        """Wait until the server's XPUB socket has seen this client's SUB socket.
+
+        The client subscribes to a throwaway token topic and asks the server over
+        the control channel whether that subscription has arrived. Servers that
+        do not support the handshake get the old fixed slow-joiner delay.
+        """
+        token = f"\x00sub-{uuid.uuid4().hex}"
+        self.data_socket.setsockopt(zmq.SUBSCRIBE, token.encode())
+        request = {
+            MessageFields.TYPE: ControlMessageType.AWAIT_SUBSCRIPTION.value,
+            MessageFields.TOKEN: token,
+        }
+        deadline = time.monotonic() + timeout
+        try:
+            while time.monotonic() < deadline:
+                response = self._send_control_request(request, timeout_ms=int(timeout * 1000))
+                if response.get(MessageFields.TYPE) != ResponseType.SUBSCRIPTION_ACK.value:
+                    time.sleep(0.1)
+                    return False
+                if response.get(MessageFields.SUBSCRIBED):
+                    return True
+                time.sleep(0.001)
+            return False
+        except TimeoutError:
+            return False
+        finally:
+            self.data_socket.setsockopt(zmq.UNSUBSCRIBE, token.encode())
+
+    def _create_control_socket(self):
+        sock = self._ensure_context().socket(zmq.REQ)
+        sock.setsockopt(zmq.LINGER, 0)
+        # A relaxed REQ may send again after a missed reply, and correlation ids
+        # make it drop the stale reply if that one arrives late.
+        sock.setsockopt(zmq.REQ_RELAXED, 1)
+        sock.setsockopt(zmq.REQ_CORRELATE, 1)
+        if self._apply_tcp_options(sock):
+            # Only queue requests on completed connections so a dead server
+            # surfaces as a send timeout instead of a silently parked request.
+            sock.setsockopt(zmq.IMMEDIATE, 1)
+        sock.connect(self._control_url)
+        return sock
+
+    def _apply_tcp_options(self, sock) -> bool:
+        """Enable TCP keepalive on sock in TCP mode; returns whether it applied.
+
+        libzmq already sets TCP_NODELAY on its TCP connections.
+        """
+        if self.transport_mode != TransportMode.TCP:
+            return False
+        sock.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        return True
+
+    def _send_control_request(self, request, timeout_ms: int | None = None, frames=None):
+        """Send a request over the persistent control socket and return the reply.
+
+        ``request`` is a message dict or an already-encoded message (see the
+        module-level ``_*_BYTES`` constants). ``frames`` are extra binary frames
+        (e.g. array buffers) sent after the encoded request as one multipart
+        message, without being re-encoded.
+        """
+        payload = request if isinstance(request, bytes) else encode_control_request(request)
+        if timeout_ms is None:
+            timeout_ms = self.config.ctrl_request_timeout_ms
+        with self._ctrl_lock:
+            if self.control_socket is None:
+                self.control_socket = self._create_control_socket()
+            sock = self.control_socket
+            # RCVTIMEO/SNDTIMEO are in milliseconds
+            sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
+            sock.setsockopt(zmq.SNDTIMEO, timeout_ms)
+            try:
+                if frames:
+                    sock.send_multipart([payload, *frames], copy=False)
+                else:
+                    sock.send(payload)
+                return decode_control(sock.recv())
+            except zmq.Again:
+                request_type = decode_control(payload).get(MessageFields.TYPE)
+                raise TimeoutError(
+                    f"Server did not respond to {request_type} request within {timeout_ms}ms"
+                )
 
     def _cleanup_sockets(self):
         if self.data_socket:
             self.data_socket.close()
             self.data_socket = None
-        if self.control_socket:
-            self.control_socket.close()
-            self.control_socket = None
+        with self._ctrl_lock:
+            if self.control_socket:
+                self.control_socket.close()
+                self.control_socket = None
 
         if self.zmq_context:
             self.zmq_context.term()
             self.zmq_context = None
 
     def _try_connect_to_existing(self, port: int) -> bool:
+        sock = None
         try:
             control_url = get_zmq_transport_url(
                 port + self.config.control_port_offset,
@@ -127,22 +292,18 @@ class ZMQClient(ABC):
                 config=self.config,
             )
 
-            ctx = zmq.Context()
-            sock = ctx.socket(zmq.REQ)
+            sock = self._ensure_context().socket(zmq.REQ)
             sock.setsockopt(zmq.LINGER, 0)
             sock.setsockopt(zmq.RCVTIMEO, 500)
             sock.connect(control_url)
-            sock.send(pickle.dumps({"type": "ping"}))
-            response = pickle.loads(sock.recv())
+            sock.send(_PING_BYTES)
+            response = decode_control(sock.recv())
             return response.get("type") == "pong" and response.get("ready")
         except Exception:
             return False
         finally:
-            try:
+            if sock is not None:
                 sock.close()
-                ctx.term()
-            except Exception:
-                pass
 
     def _wait_for_server_ready(self, timeout: float = 10.0) -> bool:
         return wait_for_server_ready(
@@ -154,6 +315,10 @@ class ZMQClient(ABC):
         )
 
     def _is_port_in_use(self, port: int) -> bool:
+        if self.transport_mode == TransportMode.IPC:
+            # An IPC endpoint is in use exactly when its socket file exists
+            path = self._ipc_socket_path if port == self.port else get_ipc_socket_path(port, self.config)
+            return path is not None and os.path.exists(path)
         return is_port_in_use(
             port,
             self.transport_mode,
@@ -162,6 +327,8 @@ class ZMQClient(ABC):
         )
 
     def _find_free_port(self):
+        if self.transport_mode == TransportMode.IPC:
+            raise ValueError("Free TCP ports are meaningless in IPC mode; pick any unused port number.")
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.bind(("", 0))
             return s.getsockname()[1]
@@ -172,6 +339,9 @@ class ZMQClient(ABC):
                 remove_ipc_socket(port, self.config)
                 return
 
+            if self._kill_listeners_with_psutil(port):
+                return
+
             system = platform.system()
             if system in ["Linux", "Darwin"]:
                 result = subprocess.run(
@@ -199,47 +369,92 @@ class ZMQClient(ABC):
         except Exception:
             pass
 
+    @staticmethod
+    def _kill_listeners_with_psutil(port: int) -> bool:
+        """Kill TCP listeners on port in-process; False if psutil cannot be used."""
+        try:
+            import psutil
+        except ImportError:
+            return False
+        try:
+            connections = psutil.net_connections(kind="tcp")
+        except psutil.AccessDenied:
+            return False
+        for conn in connections:
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN and conn.pid:
+                try:
+                    psutil.Process(conn.pid).kill()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        return True
+
     @staticmethod
     def scan_servers(
         ports,
         host: str = "localhost",
-        timeout_ms: int = 200,
+        timeout_ms: int | None = None,
         transport_mode: TransportMode | None = None,
         config: ZMQConfig | None = None,
+        context: zmq.Context | None = None,
     ):
         config = config or ZMQConfig()
+        # Iterated twice (send, then ordering the result); accept generators
+        ports = list(ports)
+        if timeout_ms is None:
+            timeout_ms = config.scan_timeout_ms
         transport_mode = transport_mode or get_default_transport_mode()
-        servers = []
-        for port in ports:
-            try:
-                control_port = port + config.control_port_offset
-                control_url = get_zmq_transport_url(
-                    control_port,
-                    host=host,
-                    mode=transport_mode,
-                    config=config,
-                )
-
-                ctx = zmq.Context()
-                sock = ctx.socket(zmq.REQ)
-                sock.setsockopt(zmq.LINGER, 0)
-                sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
-                sock.connect(control_url)
-                sock.send(pickle.dumps({"type": "ping"}))
-                pong = pickle.loads(sock.recv())
-                if pong.get("type") == "pong":
-                    pong["port"] = port
-                    pong["control_port"] = control_port
-                    servers.append(pong)
-            except Exception:
-                pass
-            finally:
+        ctx = context or zmq.Context()
+        poller = zmq.Poller()
+        pending = {}
+        pongs = {}
+        try:
+            # Ping every port at once and wait for all replies together, so the
+            # scan costs one timeout in total rather than one per silent port.
+            for port in ports:
+                sock = None
                 try:
-                    sock.close()
-                    ctx.term()
+                    control_url = get_zmq_transport_url(
+                        port + config.control_port_offset,
+                        host=host,
+                        mode=transport_mode,
+                        config=config,
+                    )
+                    sock = ctx.socket(zmq.REQ)
+                    sock.setsockopt(zmq.LINGER, 0)
+                    sock.connect(control_url)
+                    sock.send(_PING_BYTES, zmq.NOBLOCK)
                 except Exception:
-                    pass
-        return servers
+                    if sock is not None:
+                        sock.close()
+                    continue
+                poller.register(sock, zmq.POLLIN)
+                pending[sock] = port
+
+            deadline = time.monotonic() + timeout_ms / 1000
+            while pending:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    break
+                # zmq poll timeouts are milliseconds
+                for sock, _ in poller.poll(remaining_ms):
+                    port = pending.pop(sock)
+                    poller.unregister(sock)
+                    try:
+                        pong = decode_control(sock.recv(zmq.NOBLOCK))
+                        if pong.get("type") == "pong":
+                            pong["port"] = port
+                            pong["control_port"] = port + config.control_port_offset
+                            pongs[port] = pong
+                    except Exception:
+                        pass
+                    finally:
+                        sock.close()
+        finally:
+            for sock in pending:
+                sock.close()
+            if context is None:
+                ctx.term()
+        return [pongs[port] for port in ports if port in pongs]
 
     @staticmethod
     def kill_server_on_port(
@@ -249,28 +464,11 @@ class ZMQClient(ABC):
         transport_mode: TransportMode | None = None,
         host: str = "localhost",
         config: ZMQConfig | None = None,
+        context: zmq.Context | None = None,
     ):
         config = config or ZMQConfig()
         transport_mode = transport_mode or get_default_transport_mode()
-        msg_type = "shutdown" if graceful else "force_shutdown"
-
-        def is_port_free(port: int) -> bool:
-            if transport_mode == TransportMode.IPC:
-                socket_path = get_ipc_socket_path(port, config)
-                return not (socket_path and socket_path.exists())
-            sock_test = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock_test.settimeout(0.1)
-            try:
-                sock_test.bind(("localhost", port))
-                sock_test.close()
-                return True
-            except OSError:
-                return False
-            finally:
-                try:
-                    sock_test.close()
-                except Exception:
-                    pass
+        shutdown_bytes = _SHUTDOWN_BYTES if graceful else _FORCE_SHUTDOWN_BYTES
 
         try:
             control_port = port + config.control_port_offset
@@ -281,21 +479,21 @@ class ZMQClient(ABC):
                 config=config,
             )
 
-            ctx = zmq.Context()
+            ctx = context or zmq.Context()
             sock = ctx.socket(zmq.REQ)
             sock.setsockopt(zmq.LINGER, 0)
             sock.connect(control_url)
 
             if graceful:
                 sock.setsockopt(zmq.RCVTIMEO, int(timeout * 1000))
-                sock.send(pickle.dumps({"type": msg_type}))
-                ack = pickle.loads(sock.recv())
+                sock.send(shutdown_bytes)
+                ack = decode_control(sock.recv())
                 if ack.get("type") == "shutdown_ack":
                     return True
             else:
                 sock.setsockopt(zmq.SNDTIMEO, 1000)
                 try:
-                    sock.send(pickle.dumps({"type": msg_type}))
+                    sock.send(shutdown_bytes)
                 except Exception:
                     pass
 
@@ -323,7 +521,8 @@ class ZMQClient(ABC):
         finally:
             try:
                 sock.close()
-                ctx.term()
+                if context is None:
+                    ctx.term()
             except Exception:
                 pass
 
@@ -331,7 +530,7 @@ class ZMQClient(ABC):
 
     @abstractmethod
     def _spawn_server_process(self):
-        pass
+        """Start the server; return a ServerHandle, multiprocessing.Process or Popen."""
 
     @abstractmethod
     def send_data(self, data):
@@ -0,0 +1,97 @@
+"""Wire codecs for ZMQ control and data-channel messages."""
+from __future__ import annotations
+
+import json
+import pickle
+
+import msgpack
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+# Pickle protocol >= 2 frames start with PROTO (0x80) followed by the protocol
+# number. A msgpack payload only starts with 0x80 for an empty map, which is a
+# single byte, so the two formats can be told apart from the first two bytes.
+_PICKLE_PROTO = 0x80
+# Data-channel messages are maps; a leading "{" can only be a JSON object.
+_JSON_OBJECT = ord("{")
+
+if orjson is not None:
+    # orjson parses bytes-like objects (memoryviews included) without a copy
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    def _json_loads(buf):
+        return json.loads(bytes(buf))
+
+    def _json_dumps(message):
+        return json.dumps(message).encode("utf-8")
+
+
+def encode_control(message) -> bytes:
+    """Encode a control reply dict for the wire.
+
+    Replies carrying arbitrary Python objects fall back to pickle, which
+    decode_control accepts on the client side.
+    """
+    try:
+        return msgpack.packb(message, use_bin_type=True)
+    except (TypeError, ValueError, OverflowError):
+        return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def encode_control_request(message) -> bytes:
+    """Encode a control request; msgpack only, to match decode_control_request."""
+    try:
+        return msgpack.packb(message, use_bin_type=True)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise TypeError(f"Control request is not msgpack-serializable: {e}") from e
+
+
+def decode_control(buf):
+    """Decode a control reply, accepting legacy pickle payloads.
+
+    Only for clients reading replies from a server they chose to talk to;
+    servers decode incoming requests with decode_control_request.
+    """
+    view = memoryview(buf)
+    if len(view) > 1 and view[0] == _PICKLE_PROTO:
+        return pickle.loads(view)
+    return msgpack.unpackb(view, raw=False, strict_map_key=False)
+
+
+def decode_control_request(buf):
+    """Decode an incoming control request; msgpack only, never pickle."""
+    return msgpack.unpackb(buf, raw=False, strict_map_key=False)
+
+
+def encode_data(message) -> bytes:
+    """Encode a data-channel message (acks, progress) for the wire."""
+    return msgpack.packb(message, use_bin_type=True)
+
+
+def encode_json(message) -> bytes:
+    """Encode a data-channel message as UTF-8 JSON bytes."""
+    return _json_dumps(message)
+
+
+def decode_json(buf):
+    """Decode UTF-8 JSON from a bytes-like object."""
+    try:
+        return _json_loads(buf)
+    except ValueError:
+        if orjson is None:
+            raise
+        # orjson is stricter than the stdlib (NaN/Infinity, big ints);
+        # fall back so anything json.dumps produced still decodes.
+        return json.loads(bytes(buf))
+
+
+def decode_data(buf):
+    """Decode a data-channel message, accepting legacy JSON payloads."""
+    view = memoryview(buf)
+    if len(view) and view[0] == _JSON_OBJECT:
+        return decode_json(view)
+    return msgpack.unpackb(view, raw=False, strict_map_key=False)
@@ -11,7 +11,7 @@ class TransportMode(Enum):
     IPC = "ipc"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ZMQConfig:
     """Configuration for ZMQ transport."""
     control_port_offset: int = 1000
@@ -21,3 +21,8 @@ class ZMQConfig:
     ipc_socket_extension: str = ".sock"
     shared_ack_port: int = 7555
     app_name: str = "zmqruntime"
+    # ZMQ poll/recv timeouts, all in milliseconds
+    ack_poll_interval_ms: int = 1000
+    progress_poll_interval_ms: int = 100
+    scan_timeout_ms: int = 200
+    ctrl_request_timeout_ms: int = 5000
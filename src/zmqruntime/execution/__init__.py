@@ -1,7 +1,7 @@
 """Execution pattern APIs."""
 from __future__ import annotations
 
-from zmqruntime.execution.client import ExecutionClient
+from zmqruntime.execution.client import ExecutionClient, ProgressPump
 from zmqruntime.execution.server import ExecutionServer
 
-__all__ = ["ExecutionClient", "ExecutionServer"]
+__all__ = ["ExecutionClient", "ExecutionServer", "ProgressPump"]
@@ -1,77 +1,220 @@
 """Execution client with submit/poll/wait and progress streaming."""
 from __future__ import annotations
 
-import pickle
-import json
 import logging
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
 
 import zmq
 
-from zmqruntime.client import ZMQClient
+from zmqruntime.client import _PING_BYTES, _STATUS_BYTES, ZMQClient
+from zmqruntime.codec import decode_data
 from zmqruntime.messages import ControlMessageType, ExecutionStatus, MessageFields
-from zmqruntime.transport import get_zmq_transport_url
 
 logger = logging.getLogger(__name__)
 
+_MAX_COMPLETION_EVENTS = 1024
+
+
+class ProgressPump:
+    """Singleton IO thread that services the progress sockets of all clients.
+
+    Every ExecutionClient in the process registers its data socket here instead
+    of running its own listener thread. One thread polls all registered sockets,
+    drains whatever is ready and hands each raw message to the owner's handler.
+    Registration changes are queued and applied by the pump thread so sockets are
+    only ever touched from one thread while registered.
+    """
+
+    _instance: Optional["ProgressPump"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        with self._lock:
+            if self._initialized:
+                return
+            self._handlers: dict[zmq.Socket, Callable[[memoryview], None]] = {}
+            self._poller = zmq.Poller()
+            self._changes: list[tuple] = []
+            self._changes_lock = threading.Lock()
+            self._poll_interval_ms = 100
+            self._thread: Optional[threading.Thread] = None
+            self._initialized = True
+
+    def register(self, socket, handler: Callable[[memoryview], None], poll_interval_ms: int | None = None) -> None:
+        """Start delivering messages received on socket to handler."""
+        with self._changes_lock:
+            if poll_interval_ms is not None:
+                self._poll_interval_ms = min(self._poll_interval_ms, poll_interval_ms)
+            self._changes.append((socket, handler, None))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._pump_loop, daemon=True, name="ProgressPump")
+                self._thread.start()
+
+    def unregister(self, socket, timeout: float = 2.0) -> None:
+        """Stop servicing socket; returns once the pump no longer touches it."""
+        if threading.current_thread() is self._thread:
+            self._remove(socket)
+            return
+        done = threading.Event()
+        with self._changes_lock:
+            if self._thread is None:
+                return
+            self._changes.append((socket, None, done))
+        done.wait(timeout)
+
+    def _remove(self, socket) -> None:
+        if self._handlers.pop(socket, None) is not None:
+            self._poller.unregister(socket)
+
+    def _apply_changes(self) -> bool:
+        """Apply queued (un)registrations; False once there is nothing left to pump."""
+        with self._changes_lock:
+            changes, self._changes = self._changes, []
+            for socket, handler, done in changes:
+                if handler is None:
+                    self._remove(socket)
+                    done.set()
+                elif socket not in self._handlers:
+                    self._handlers[socket] = handler
+                    self._poller.register(socket, zmq.POLLIN)
+            if not self._handlers:
+                self._thread = None
+                return False
+            return True
+
+    def _pump_loop(self) -> None:
+        logger.info("Progress pump started")
+        try:
+            while self._apply_changes():
+                try:
+                    # zmq poll timeouts are milliseconds, not seconds
+                    events = self._poller.poll(self._poll_interval_ms)
+                except zmq.ZMQError as e:
+                    logger.warning("Progress pump poll error: %s", e)
+                    time.sleep(0.1)
+                    continue
+                for socket, _ in events:
+                    self._drain(socket)
+        except Exception as e:
+            logger.error("Progress pump crashed: %s", e, exc_info=True)
+            with self._changes_lock:
+                self._thread = None
+        finally:
+            logger.info("Progress pump exited")
+
+    def _drain(self, socket) -> None:
+        # Drain everything queued per wakeup so bursts of progress messages
+        # cost one poll rather than one poll each.
+        while socket in self._handlers:
+            try:
+                # copy=False hands the handler a view of the zmq buffer
+                message = socket.recv(zmq.NOBLOCK, copy=False).buffer
+            except zmq.Again:
+                return
+            except zmq.ZMQError as e:
+                logger.warning("Progress pump receive error: %s", e)
+                return
+            try:
+                self._handlers[socket](message)
+            except Exception as e:
+                logger.warning("Progress handler error: %s", e)
+
 
 class ExecutionClient(ZMQClient, ABC):
     """Execution client with progress streaming."""
 
+    # Terminal execution status -> builder for wait_for_completion's result
+    _TERMINAL = {
+        ExecutionStatus.COMPLETE.value: lambda execution_id, execution: {
+            MessageFields.STATUS: ExecutionStatus.COMPLETE.value,
+            MessageFields.EXECUTION_ID: execution_id,
+            "results": execution.get(MessageFields.RESULTS_SUMMARY, {}),
+        },
+        ExecutionStatus.FAILED.value: lambda execution_id, execution: {
+            MessageFields.STATUS: ExecutionStatus.FAILED.value,
+            MessageFields.EXECUTION_ID: execution_id,
+            MessageFields.MESSAGE: execution.get(MessageFields.ERROR),
+        },
+        ExecutionStatus.CANCELLED.value: lambda execution_id, execution: {
+            MessageFields.STATUS: ExecutionStatus.CANCELLED.value,
+            MessageFields.EXECUTION_ID: execution_id,
+            MessageFields.MESSAGE: "Execution was cancelled",
+        },
+    }
+
     def __init__(self, port: int, host: str = "localhost", persistent: bool = True,
                  progress_callback=None, transport_mode=None, config=None):
         super().__init__(port, host, persistent, transport_mode=transport_mode, config=config)
         self.progress_callback = progress_callback
-        self._progress_thread: threading.Thread | None = None
-        self._progress_stop_event = threading.Event()
+        self._progress_socket: zmq.Socket | None = None
+        self._completion_events: OrderedDict[str, threading.Event] = OrderedDict()
+        self._completion_lock = threading.Lock()
+        # In-flight idempotent requests keyed by (type, execution_id); concurrent
+        # callers asking the same question share one round trip.
+        self._pending: dict[tuple, Future] = {}
+        self._pending_lock = threading.Lock()
 
     def _start_progress_listener(self):
-        if self._progress_thread and self._progress_thread.is_alive():
+        if self._progress_socket is not None:
             logger.info("Progress listener already running")
             return
-        if not self.progress_callback:
-            logger.info("No progress callback, skipping listener")
+        if not self.data_socket:
+            logger.info("No data socket, skipping listener")
             return
-        logger.info("Starting progress listener thread")
-        self._progress_stop_event.clear()
-        self._progress_thread = threading.Thread(target=self._progress_listener_loop, daemon=True)
-        self._progress_thread.start()
+        logger.info("Registering progress listener with the shared progress pump")
+        self._progress_socket = self.data_socket
+        ProgressPump().register(
+            self._progress_socket,
+            self._on_progress_message,
+            poll_interval_ms=self.config.progress_poll_interval_ms,
+        )
 
     def _stop_progress_listener(self):
-        if not self._progress_thread:
+        if self._progress_socket is None:
             return
-        self._progress_stop_event.set()
-        if self._progress_thread.is_alive():
-            self._progress_thread.join(timeout=2)
-        self._progress_thread = None
+        ProgressPump().unregister(self._progress_socket)
+        self._progress_socket = None
 
-    def _progress_listener_loop(self):
-        logger.info("Progress listener loop started")
-        try:
-            while not self._progress_stop_event.is_set():
-                if not self.data_socket:
-                    time.sleep(0.1)
-                    continue
-                try:
-                    message = self.data_socket.recv_string(zmq.NOBLOCK)
-                    data = json.loads(message)
-                    if self.progress_callback and data.get("type") == "progress":
-                        try:
-                            self.progress_callback(data)
-                        except Exception as e:
-                            logger.warning("Progress callback error: %s", e)
-                except zmq.Again:
-                    time.sleep(0.05)
-                except Exception as e:
-                    logger.warning("Progress listener error: %s", e)
-                    time.sleep(0.1)
-        except Exception as e:
-            logger.error("Progress listener loop crashed: %s", e, exc_info=True)
-        finally:
-            logger.info("Progress listener loop exited")
+    def _on_progress_message(self, message):
+        self._handle_progress_message(decode_data(message))
+
+    def _handle_progress_message(self, data):
+        message_type = data.get("type")
+        if message_type == "status":
+            if data.get(MessageFields.STATUS) in self._TERMINAL:
+                self._completion_event(data.get(MessageFields.EXECUTION_ID)).set()
+        elif self.progress_callback and message_type == "progress":
+            try:
+                self.progress_callback(data)
+            except Exception as e:
+                logger.warning("Progress callback error: %s", e)
+
+    def _completion_event(self, execution_id) -> threading.Event:
+        with self._completion_lock:
+            event = self._completion_events.get(execution_id)
+            if event is None:
+                event = self._completion_events[execution_id] = threading.Event()
+                # Status events are broadcast to every subscriber, so only keep
+                # the most recent ones around.
+                while len(self._completion_events) > _MAX_COMPLETION_EVENTS:
+                    self._completion_events.popitem(last=False)
+            return event
 
     def submit_execution(self, task: Any, config: Any = None):
         if not self._connected and not self.connect():
@@ -79,24 +222,76 @@ class ExecutionClient(ZMQClient, ABC):
         if self.progress_callback:
             self._start_progress_listener()
         request = self.serialize_task(task, config)
+        frames = None
+        if isinstance(request, tuple):
+            request, frames = request
         if MessageFields.TYPE not in request:
             request[MessageFields.TYPE] = ControlMessageType.EXECUTE.value
-        response = self._send_control_request(request)
-        return response
+        if frames:
+            return self._send_control_request(request, frames=frames)
+        return self._send_control_request(request)
 
     def poll_status(self, execution_id: str | None = None):
-        request = {MessageFields.TYPE: ControlMessageType.STATUS.value}
-        if execution_id:
-            request[MessageFields.EXECUTION_ID] = execution_id
-        return self._send_control_request(request)
+        key = (ControlMessageType.STATUS, execution_id)
+        if not execution_id:
+            return self._send_coalesced(key, _STATUS_BYTES)
+        request = {
+            MessageFields.TYPE: ControlMessageType.STATUS.value,
+            MessageFields.EXECUTION_ID: execution_id,
+        }
+        return self._send_coalesced(key, request)
+
+    def _send_coalesced(self, key, request, **kwargs):
+        """Send request, or wait on an identical request already in flight."""
+        with self._pending_lock:
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            response = self._send_control_request(request, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._pending_lock:
+                del self._pending[key]
+
+    def wait_for_completion(self, execution_id, poll_interval=0.5, max_consecutive_errors=5,
+                            liveness_interval=5.0):
+        """Block until the execution reaches a terminal state.
 
-    def wait_for_completion(self, execution_id, poll_interval=0.5, max_consecutive_errors=5):
+        With the progress listener running, the server's status event wakes the
+        wait immediately and STATUS is only polled every ``liveness_interval``
+        seconds as a liveness check. Without it, STATUS is polled every
+        ``poll_interval`` seconds.
+        """
         logger.info("Waiting for execution %s to complete", execution_id)
+        self._start_progress_listener()
+        completion_event = self._completion_event(execution_id)
+        try:
+            return self._wait_for_terminal_status(
+                execution_id, completion_event, poll_interval, max_consecutive_errors, liveness_interval
+            )
+        finally:
+            with self._completion_lock:
+                self._completion_events.pop(execution_id, None)
+
+    def _wait_for_terminal_status(self, execution_id, completion_event, poll_interval,
+                                  max_consecutive_errors, liveness_interval):
         consecutive_errors = 0
         poll_count = 0
 
         while True:
-            time.sleep(poll_interval)
+            if self._progress_socket is not None:
+                completion_event.wait(liveness_interval)
+            else:
+                time.sleep(poll_interval)
             poll_count += 1
             try:
                 status_response = self.poll_status(execution_id)
@@ -105,24 +300,9 @@ class ExecutionClient(ZMQClient, ABC):
                 if status_response.get(MessageFields.STATUS) == "ok":
                     execution = status_response.get("execution", {})
                     exec_status = execution.get(MessageFields.STATUS)
-                    if exec_status == ExecutionStatus.COMPLETE.value:
-                        return {
-                            MessageFields.STATUS: ExecutionStatus.COMPLETE.value,
-                            MessageFields.EXECUTION_ID: execution_id,
-                            "results": execution.get(MessageFields.RESULTS_SUMMARY, {}),
-                        }
-                    if exec_status == ExecutionStatus.FAILED.value:
-                        return {
-                            MessageFields.STATUS: ExecutionStatus.FAILED.value,
-                            MessageFields.EXECUTION_ID: execution_id,
-                            MessageFields.MESSAGE: execution.get(MessageFields.ERROR),
-                        }
-                    if exec_status == ExecutionStatus.CANCELLED.value:
-                        return {
-                            MessageFields.STATUS: ExecutionStatus.CANCELLED.value,
-                            MessageFields.EXECUTION_ID: execution_id,
-                            MessageFields.MESSAGE: "Execution was cancelled",
-                        }
+                    build_result = self._TERMINAL.get(exec_status)
+                    if build_result is not None:
+                        return build_result(execution_id, execution)
                 elif status_response.get(MessageFields.STATUS) == "error":
                     error_msg = status_response.get(MessageFields.MESSAGE, "Unknown error")
                     return {
@@ -172,54 +352,21 @@ class ExecutionClient(ZMQClient, ABC):
         try:
             if not self._connected and not self.connect():
                 return {MessageFields.STATUS: "error", MessageFields.MESSAGE: "Not connected"}
-            ctx = zmq.Context()
-            sock = ctx.socket(zmq.REQ)
-            sock.setsockopt(zmq.LINGER, 0)
-            sock.setsockopt(zmq.RCVTIMEO, 1000)
-            control_url = get_zmq_transport_url(
-                self.control_port,
-                host=self.host,
-                mode=self.transport_mode,
-                config=self.config,
-            )
-            sock.connect(control_url)
-            sock.send(pickle.dumps({MessageFields.TYPE: ControlMessageType.PING.value}))
-            response = pickle.loads(sock.recv())
-            sock.close()
-            ctx.term()
-            return response
+            return self._send_coalesced((ControlMessageType.PING, None), _PING_BYTES, timeout_ms=1000)
         except Exception:
             return {MessageFields.STATUS: "error", MessageFields.MESSAGE: "Failed"}
 
-    def _send_control_request(self, request, timeout_ms=5000):
-        ctx = zmq.Context()
-        sock = ctx.socket(zmq.REQ)
-        sock.setsockopt(zmq.LINGER, 0)
-        sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
-        control_url = get_zmq_transport_url(
-            self.control_port,
-            host=self.host,
-            mode=self.transport_mode,
-            config=self.config,
-        )
-        sock.connect(control_url)
-        try:
-            sock.send(pickle.dumps(request))
-            response = sock.recv()
-            return pickle.loads(response)
-        except zmq.Again:
-            raise TimeoutError(
-                f"Server did not respond to {request.get(MessageFields.TYPE)} request within {timeout_ms}ms"
-            )
-        finally:
-            sock.close()
-            ctx.term()
-
     def disconnect(self):
         self._stop_progress_listener()
         super().disconnect()
 
     @abstractmethod
-    def serialize_task(self, task: Any, config: Any) -> dict:
-        """Serialize task for transmission. Subclass provides serialization logic."""
+    def serialize_task(self, task: Any, config: Any) -> dict | tuple[dict, list]:
+        """Serialize task for transmission. Subclass provides serialization logic.
+
+        Return either the request dict, or ``(request, frames)`` where ``frames``
+        are bytes-like payloads (e.g. ``ndarray`` buffers) sent as extra
+        multipart frames instead of being embedded in the encoded request. The
+        server exposes them as ``ExecuteRequest.payload_frames``.
+        """
         raise NotImplementedError
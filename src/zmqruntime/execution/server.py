@@ -1,24 +1,30 @@
 """Generic ZMQ execution server with queue-based processing."""
 from __future__ import annotations
 
-import json
 import logging
 import os
 import queue
+import signal
+import sys
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
-from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, deque
 from typing import Any
 
+import zmq
+
+from zmqruntime.codec import encode_data
 from zmqruntime.messages import (
     CancelRequest,
     ControlMessageType,
     ExecuteRequest,
     ExecuteResponse,
+    ExecutionRecord,
     ExecutionStatus,
     MessageFields,
+    ProgressUpdate,
     PongResponse,
     ResponseType,
     StatusRequest,
@@ -28,11 +34,96 @@ from zmqruntime.server import ZMQServer
 
 logger = logging.getLogger(__name__)
 
+_SHUTDOWN_SENTINEL = object()
+
+_UUID_BATCH = 256
+_uuid_pool: list[bytes] = []
+_uuid_lock = threading.Lock()
+
+
+def _new_execution_id() -> str:
+    """Return a random UUID4 string, drawing entropy 256 ids at a time."""
+    with _uuid_lock:
+        if not _uuid_pool:
+            entropy = os.urandom(16 * _UUID_BATCH)
+            _uuid_pool.extend(entropy[i:i + 16] for i in range(0, len(entropy), 16))
+        raw = _uuid_pool.pop()
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the ids left in its parent's pool
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+_TERMINAL_STATUSES = frozenset(
+    status.value
+    for status in (
+        ExecutionStatus.COMPLETE,
+        ExecutionStatus.COMPLETED,
+        ExecutionStatus.FAILED,
+        ExecutionStatus.CANCELLED,
+    )
+)
+
+# Status values bound once. _set_status interns every status it stores, so
+# checks against a record's status can compare identity.
+_QUEUED = ExecutionStatus.QUEUED.value
+_RUNNING = ExecutionStatus.RUNNING.value
+_COMPLETE = ExecutionStatus.COMPLETE.value
+_FAILED = ExecutionStatus.FAILED.value
+_CANCELLED = ExecutionStatus.CANCELLED.value
+_OK = ResponseType.OK.value
+
+_DISPATCHED_TYPES = (
+    ControlMessageType.EXECUTE,
+    ControlMessageType.STATUS,
+    ControlMessageType.CANCEL,
+    ControlMessageType.SHUTDOWN,
+    ControlMessageType.FORCE_SHUTDOWN,
+)
+
+
+def _pid_exited(pid: int) -> bool:
+    """Reap pid if it is our child; report whether it is gone."""
+    try:
+        reaped, _ = os.waitpid(pid, os.WNOHANG)
+        return reaped == pid
+    except ChildProcessError:
+        # Not our child (e.g. a grandchild); probe with signal 0 instead
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+
+def _wait_for_exit(pids: list[int], timeout: float) -> list[int]:
+    """Poll until pids exit or timeout passes; return those still alive."""
+    deadline = time.monotonic() + timeout
+    while pids:
+        pids = [pid for pid in pids if not _pid_exited(pid)]
+        if not pids or time.monotonic() >= deadline:
+            break
+        time.sleep(0.05)
+    return pids
+
 
 class ExecutionServer(ZMQServer, ABC):
     """Queue-based execution server with progress streaming."""
 
     _server_type = "execution"
+    # Two workers, so a ping is still answered while the other worker sits in
+    # a slow handler (cancel/shutdown wait up to 3 s for workers to die)
+    control_worker_threads = 2
+    # Seconds a psutil worker scan is reused for in pong responses
+    worker_info_ttl = 1.0
+    # Finished executions kept for status queries before the oldest are dropped
+    max_execution_history = 1024
+    # Executions run at once, each on its own queue worker thread
+    max_concurrent_executions = 1
+    progress_batch_size = 64
 
     def __init__(self, port: int | None = None, host: str = "*", log_file_path: str | None = None,
                  transport_mode=None, config: ZMQConfig | None = None):
@@ -40,83 +131,206 @@ class ExecutionServer(ZMQServer, ABC):
         if port is None:
             port = config.default_port
         super().__init__(port, host, log_file_path, transport_mode=transport_mode, config=config)
-        self.active_executions: dict[str, dict] = {}
-        self.start_time = None
-        self.progress_queue: queue.Queue = queue.Queue()
+        self.active_executions: dict[str, ExecutionRecord] = {}
+        # Finished execution ids, oldest first; trimmed to max_execution_history
+        self._history: OrderedDict[str, None] = OrderedDict()
+        # Guards inserts into and iteration over active_executions and the
+        # status index, which the control workers and queue threads share.
+        # Reentrant because _finish holds it around _set_status.
+        self._executions_lock = threading.RLock()
+        # Execution ids indexed by status value, kept in step by _set_status
+        self._by_status: dict[str, set[str]] = {status.value: set() for status in ExecutionStatus}
+        self._pong_cache: dict | None = None
+        self._pong_fragments: dict[str, dict] = {}
+        self._pong_dirty = True
+        self._worker_info: list[dict] = []
+        self._worker_scan_time = float("-inf")
+        self._worker_info_thread: threading.Thread | None = None
+        self._worker_pids: set[int] = set()
+        # Registered worker PIDs per execution, so cleanup and cancel only
+        # touch the workers of the execution they concern
+        self._execution_pids: dict[str, set[int]] = {}
+        self.start_time = None  # wall clock, for display
+        self._start_monotonic: float | None = None  # for uptime
+        # Many producers (execution threads) append, the server loop pops.
+        # deque.append/popleft are atomic, so neither side takes a lock.
+        # Items are ready-to-send zmq.Frames, built on the producer's thread.
+        self.progress_queue: deque[zmq.Frame] = deque()
 
         self.execution_queue: queue.Queue = queue.Queue()
+        # Wire type string -> bound handler, resolved once instead of per message
+        self._dispatch = {
+            message_type.value: getattr(self, message_type.get_handler_method())
+            for message_type in _DISPATCHED_TYPES
+        }
         self.queue_worker_thread: threading.Thread | None = None
+        self._queue_workers: list[threading.Thread] = []
+        # Set once shutdown begins: new executions are rejected and anything
+        # still queued is cancelled instead of run.
+        self._shutdown = threading.Event()
 
     def start(self):
         super().start()
+        self._shutdown.clear()
         self.start_time = self.start_time or time.time()
+        if self._start_monotonic is None:
+            self._start_monotonic = time.monotonic()
         self._start_queue_worker()
+        self._start_worker_info_refresher()
+
+    def _uptime(self) -> float:
+        return time.monotonic() - self._start_monotonic if self._start_monotonic is not None else 0
+
+    def _snapshot_executions(self) -> list[tuple[str, dict]]:
+        with self._executions_lock:
+            return list(self.active_executions.items())
+
+    def _set_status(self, record, status):
+        """Move record to status and keep the status index in step."""
+        execution_id = record.execution_id
+        status = sys.intern(status)
+        # Control workers and queue workers both move records (a cancel can
+        # race a completion), so the read-modify-write of the index is locked.
+        with self._executions_lock:
+            previous = record.status
+            record.status = status
+            if previous in self._by_status:
+                self._by_status[previous].discard(execution_id)
+            self._by_status.setdefault(status, set()).add(execution_id)
+            if status is _RUNNING:
+                # The pong entry for a running execution never changes apart from
+                # ELAPSED, so it is built once here rather than on every ping.
+                self._pong_fragments[execution_id] = {
+                    MessageFields.EXECUTION_ID: execution_id,
+                    MessageFields.PLATE_ID: record.plate_id or "unknown",
+                    MessageFields.START_TIME: record.start_time or time.time(),
+                }
+            else:
+                self._pong_fragments.pop(execution_id, None)
+            self._pong_dirty = True
+        if status in _TERMINAL_STATUSES:
+            self._retire(execution_id)
+
+    def _finish(self, record, status, **fields):
+        """Set fields and a terminal status unless record already has one.
+
+        Returns whether this call finished the record, so exactly one of a
+        racing completion and cancel publishes the terminal event.
+        """
+        with self._executions_lock:
+            if record.status in _TERMINAL_STATUSES:
+                return False
+            for name, value in fields.items():
+                setattr(record, name, value)
+            self._set_status(record, status)
+        return True
+
+    def _retire(self, execution_id):
+        """Add a finished execution to the history and evict the oldest beyond the cap."""
+        with self._executions_lock:
+            self._history[execution_id] = None
+            self._history.move_to_end(execution_id)
+            while len(self._history) > self.max_execution_history:
+                evicted, _ = self._history.popitem(last=False)
+                record = self.active_executions.pop(evicted, None)
+                if record is not None:
+                    self._by_status.get(record.status, set()).discard(evicted)
+
+    def _refresh_worker_info(self, now=None):
+        self._worker_info = self._get_worker_info()
+        self._worker_scan_time = time.time() if now is None else now
+        self._pong_dirty = True
+
+    def _start_worker_info_refresher(self):
+        if self._worker_info_thread is not None and self._worker_info_thread.is_alive():
+            return
+
+        def refresh_loop():
+            while True:
+                try:
+                    self._refresh_worker_info()
+                except Exception as e:
+                    logger.warning("Worker info refresh failed: %s", e)
+                if self._shutdown.wait(self.worker_info_ttl):
+                    return
+
+        self._worker_info_thread = threading.Thread(target=refresh_loop, daemon=True, name="WorkerInfo")
+        self._worker_info_thread.start()
+
+    def _ids_with_status(self, *statuses: ExecutionStatus) -> list[str]:
+        return [eid for status in statuses for eid in list(self._by_status[status.value])]
 
     def _create_pong_response(self):
-        running = [
-            (eid, r)
-            for eid, r in self.active_executions.items()
-            if r.get(MessageFields.STATUS) == ExecutionStatus.RUNNING.value
-        ]
-        queued = [
-            (eid, r)
-            for eid, r in self.active_executions.items()
-            if r.get(MessageFields.STATUS) == ExecutionStatus.QUEUED.value
-        ]
-        return (
-            PongResponse(
+        # Pings are frequent but the answer only changes on execution state
+        # transitions, so the response is rebuilt when dirty and otherwise only
+        # the time-derived fields are refreshed. The psutil worker scan runs on
+        # a background thread every worker_info_ttl seconds (inline, at the same
+        # rate, when the server has not been started).
+        now = time.time()
+        refresher = self._worker_info_thread
+        if (refresher is None or not refresher.is_alive()) and (
+            now - self._worker_scan_time >= self.worker_info_ttl
+        ):
+            self._refresh_worker_info(now)
+        pong = self._pong_cache
+        if self._pong_dirty or pong is None or pong[MessageFields.READY] != self._ready:
+            self._pong_dirty = False
+            running = list(self._pong_fragments.values())
+            pong = self._pong_cache = PongResponse(
                 port=self.port,
                 control_port=self.control_port,
                 ready=self._ready,
                 server=self.__class__.__name__,
                 log_file_path=self.log_file_path,
-                active_executions=len(running) + len(queued),
-                running_executions=[
-                    {
-                        MessageFields.EXECUTION_ID: eid,
-                        MessageFields.PLATE_ID: r.get(MessageFields.PLATE_ID, "unknown"),
-                        MessageFields.START_TIME: r.get(MessageFields.START_TIME, 0),
-                        MessageFields.ELAPSED: time.time() - r.get(MessageFields.START_TIME, 0)
-                        if r.get(MessageFields.START_TIME)
-                        else 0,
-                    }
-                    for eid, r in running
-                ],
-                workers=self._get_worker_info(),
-                uptime=time.time() - self.start_time if self.start_time else 0,
+                active_executions=len(running) + len(self._by_status[_QUEUED]),
+                running_executions=running,
+                workers=self._worker_info,
             ).to_dict()
-        )
+        response = dict(pong)
+        response[MessageFields.RUNNING_EXECUTIONS] = [
+            {**fragment, MessageFields.ELAPSED: now - fragment[MessageFields.START_TIME]}
+            for fragment in pong[MessageFields.RUNNING_EXECUTIONS]
+        ]
+        response[MessageFields.UPTIME] = self._uptime()
+        return response
 
     def process_messages(self):
         super().process_messages()
-        while not self.progress_queue.empty():
+        # Queued progress is already encoded. Ready items go out as multipart
+        # messages of up to progress_batch_size frames, one update per frame,
+        # so a burst costs one send per batch rather than one per update.
+        # This loop is the only consumer, so len() is a safe lower bound and
+        # the drain needs no exception handling for an empty queue.
+        pending = self.progress_queue
+        popleft = pending.popleft
+        while self.data_socket and pending:
+            batch = [popleft() for _ in range(min(len(pending), self.progress_batch_size))]
             try:
-                if self.data_socket:
-                    self.data_socket.send_string(json.dumps(self.progress_queue.get_nowait()))
-            except (queue.Empty, Exception) as e:
-                if not isinstance(e, queue.Empty):
-                    logger.warning("Failed to send progress: %s", e)
+                self.data_socket.send_multipart(batch, zmq.NOBLOCK, copy=False)
+            except zmq.ZMQError as e:
+                logger.warning("Failed to send %s progress messages: %s", len(batch), e)
                 break
 
     def get_status_info(self):
         status = super().get_status_info()
+        executions = self._snapshot_executions()
         status.update(
             {
-                "active_executions": len(self.active_executions),
-                "uptime": time.time() - self.start_time if self.start_time else 0,
-                "executions": list(self.active_executions.values()),
+                "active_executions": len(executions),
+                "uptime": self._uptime(),
+                "executions": [r.to_dict() for _, r in executions],
             }
         )
         return status
 
     def handle_control_message(self, message):
-        try:
-            return ControlMessageType(message.get(MessageFields.TYPE)).dispatch(self, message)
-        except ValueError:
+        handler = self._dispatch.get(message.get(MessageFields.TYPE))
+        if handler is None:
             return ExecuteResponse(
                 ResponseType.ERROR,
                 error=f"Unknown message type: {message.get(MessageFields.TYPE)}",
             ).to_dict()
+        return handler(message)
 
     def handle_data_message(self, message):
         pass
@@ -124,81 +338,112 @@ class ExecutionServer(ZMQServer, ABC):
     def _validate_and_parse(self, msg, request_class):
         try:
             request = request_class.from_dict(msg)
-            if hasattr(request, "validate") and (error := request.validate()):
-                return None, ExecuteResponse(ResponseType.ERROR, error=error).to_dict()
-            return request, None
         except KeyError as e:
             return None, ExecuteResponse(ResponseType.ERROR, error=f"Missing field: {e}").to_dict()
+        if error := request.validate():
+            return None, ExecuteResponse(ResponseType.ERROR, error=error).to_dict()
+        return request, None
 
     def _start_queue_worker(self):
-        if self.queue_worker_thread is None or not self.queue_worker_thread.is_alive():
-            self.queue_worker_thread = threading.Thread(target=self._queue_worker, daemon=True)
-            self.queue_worker_thread.start()
-            logger.info("Started execution queue worker thread")
+        # A stop() that raced a worker's exit can leave a sentinel behind; the
+        # next worker would take it and quit at once, so clear them first.
+        # Workers still alive from before simply join the new pool.
+        stale = []
+        while True:
+            try:
+                item = self.execution_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.execution_queue.task_done()
+            if item is not _SHUTDOWN_SENTINEL:
+                stale.append(item)
+        for item in stale:
+            self.execution_queue.put(item)
+        self._queue_workers = [t for t in self._queue_workers if t.is_alive()]
+        for _ in range(max(1, self.max_concurrent_executions) - len(self._queue_workers)):
+            worker = threading.Thread(target=self._queue_worker, daemon=True)
+            worker.start()
+            self._queue_workers.append(worker)
+        self.queue_worker_thread = self._queue_workers[0]
+        logger.info("Started %s execution queue worker thread(s)", len(self._queue_workers))
+
+    def _stop_queue_worker(self):
+        """Wake each queue worker with exactly one shutdown sentinel."""
+        # stop() and request_shutdown() both land here; only the first posts
+        with self._executions_lock:
+            if self._shutdown.is_set():
+                return
+            self._shutdown.set()
+        for worker in self._queue_workers:
+            if worker.is_alive():
+                self.execution_queue.put(_SHUTDOWN_SENTINEL)
+
+    def stop(self):
+        super().stop()
+        self._stop_queue_worker()
+
+    def request_shutdown(self):
+        super().request_shutdown()
+        self._stop_queue_worker()
 
     def _queue_worker(self):
-        logger.info("Queue worker thread started - will process executions sequentially")
-        try:
-            while self._running:
-                try:
-                    try:
-                        execution_id, request, record = self.execution_queue.get(timeout=1.0)
-                    except queue.Empty:
-                        continue
-
-                    logger.info(
-                        "[%s] Dequeued for execution (queue size: %s)",
-                        execution_id,
-                        self.execution_queue.qsize(),
-                    )
-
-                    if not self._running:
-                        logger.info("[%s] Server shutting down, skipping execution", execution_id)
-                        record[MessageFields.STATUS] = ExecutionStatus.CANCELLED.value
-                        self.execution_queue.task_done()
-                        break
-
-                    if record[MessageFields.STATUS] == ExecutionStatus.CANCELLED.value:
-                        logger.info("[%s] Execution was cancelled while queued, skipping", execution_id)
-                        self.execution_queue.task_done()
-                        continue
-
-                    self._run_execution(execution_id, request, record)
+        logger.info("Queue worker thread started")
+        cancelled = 0
+        while True:
+            try:
+                # Blocks until work or the shutdown sentinel arrives. Each
+                # worker is sent one sentinel and exits only on it, so work
+                # queued ahead of the sentinels is cancelled, never stranded.
+                item = self.execution_queue.get()
+                if item is _SHUTDOWN_SENTINEL:
                     self.execution_queue.task_done()
-                except Exception as e:
-                    logger.error("Queue worker error: %s", e, exc_info=True)
-        finally:
-            remaining = 0
-            while not self.execution_queue.empty():
-                try:
-                    execution_id, request, record = self.execution_queue.get_nowait()
-                    record[MessageFields.STATUS] = ExecutionStatus.CANCELLED.value
-                    record[MessageFields.END_TIME] = time.time()
+                    break
+                execution_id, request, record = item
+
+                logger.info(
+                    "[%s] Dequeued for execution (queue size: %s)",
+                    execution_id,
+                    self.execution_queue.qsize(),
+                )
+
+                if self._shutdown.is_set():
+                    if record.status is not _CANCELLED:
+                        record.end_time = time.time()
+                        self._set_status(record, _CANCELLED)
                     logger.info("[%s] Cancelled (was queued when server shut down)", execution_id)
                     self.execution_queue.task_done()
-                    remaining += 1
-                except queue.Empty:
-                    break
+                    cancelled += 1
+                    continue
 
-            if remaining > 0:
-                logger.info("Cancelled %s queued executions during shutdown", remaining)
-            logger.info("Queue worker thread exiting")
+                if record.status is _CANCELLED:
+                    logger.info("[%s] Execution was cancelled while queued, skipping", execution_id)
+                    self.execution_queue.task_done()
+                    continue
+
+                self._run_execution(execution_id, request, record)
+                self.execution_queue.task_done()
+            except Exception as e:
+                logger.error("Queue worker error: %s", e, exc_info=True)
+
+        if cancelled > 0:
+            logger.info("Cancelled %s queued executions during shutdown", cancelled)
+        logger.info("Queue worker thread exiting")
 
     def _handle_execute(self, msg):
+        if self._shutdown.is_set():
+            return ExecuteResponse(ResponseType.ERROR, error="Server is shutting down").to_dict()
         request, error = self._validate_and_parse(msg, ExecuteRequest)
         if error:
             return error
-        execution_id = str(uuid.uuid4())
-        record = {
-            MessageFields.EXECUTION_ID: execution_id,
-            MessageFields.PLATE_ID: request.plate_id,
-            MessageFields.CLIENT_ADDRESS: request.client_address,
-            MessageFields.STATUS: ExecutionStatus.QUEUED.value,
-            MessageFields.START_TIME: None,
-            MessageFields.END_TIME: None,
-            MessageFields.ERROR: None,
-        }
-        self.active_executions[execution_id] = record
+        execution_id = _new_execution_id()
+        record = ExecutionRecord(
+            execution_id=execution_id,
+            plate_id=request.plate_id,
+            client_address=request.client_address,
+        )
+        with self._executions_lock:
+            self.active_executions[execution_id] = record
+        self._set_status(record, _QUEUED)
 
         self.execution_queue.put((execution_id, request, record))
         queue_position = self.execution_queue.qsize()
@@ -211,35 +456,45 @@ class ExecutionServer(ZMQServer, ABC):
         ).to_dict()
 
     def _run_execution(self, execution_id, request, record):
+        # Only the path that actually finishes the record publishes its
+        # terminal event; a cancel has already published its own.
+        finished = False
         try:
-            record[MessageFields.STATUS] = ExecutionStatus.RUNNING.value
-            record[MessageFields.START_TIME] = time.time()
+            record.start_time = time.time()
+            self._set_status(record, _RUNNING)
             logger.info("[%s] Starting execution (was queued)", execution_id)
 
             results = self.execute_task(execution_id, request)
             logger.info("[%s] Execution returned, updating status to COMPLETE", execution_id)
-            record[MessageFields.STATUS] = ExecutionStatus.COMPLETE.value
-            record[MessageFields.END_TIME] = time.time()
-            record[MessageFields.RESULTS_SUMMARY] = {
-                MessageFields.WELL_COUNT: len(results) if isinstance(results, dict) else 0,
-                MessageFields.WELLS: list(results.keys()) if isinstance(results, dict) else [],
-            }
-            logger.info(
-                "[%s] ✓ Completed in %.1fs",
-                execution_id,
-                record[MessageFields.END_TIME] - record[MessageFields.START_TIME],
+            finished = self._finish(
+                record,
+                _COMPLETE,
+                end_time=time.time(),
+                results_summary={
+                    MessageFields.WELL_COUNT: len(results) if isinstance(results, dict) else 0,
+                    MessageFields.WELLS: list(results.keys()) if isinstance(results, dict) else [],
+                },
             )
-        except Exception as e:
-            if isinstance(e, BrokenProcessPool) and record[MessageFields.STATUS] == ExecutionStatus.CANCELLED.value:
-                logger.info("[%s] Cancelled", execution_id)
+            if finished:
+                logger.info(
+                    "[%s] ✓ Completed in %.1fs",
+                    execution_id,
+                    record.end_time - record.start_time,
+                )
             else:
-                record[MessageFields.STATUS] = ExecutionStatus.FAILED.value
-                record[MessageFields.END_TIME] = time.time()
-                record[MessageFields.ERROR] = str(e)
+                logger.info("[%s] Returned after being cancelled", execution_id)
+        except Exception as e:
+            finished = self._finish(record, _FAILED, end_time=time.time(), error=str(e))
+            if finished:
                 logger.error("[%s] ✗ Failed: %s", execution_id, e, exc_info=True)
+            else:
+                # Typically a BrokenProcessPool from the cancel killing workers
+                logger.info("[%s] Cancelled", execution_id)
         finally:
-            record.pop("orchestrator", None)
-            killed = self._kill_worker_processes()
+            if finished:
+                self.send_status_update(execution_id, record.status)
+            record.orchestrator = None
+            killed = self._kill_worker_processes(execution_id)
             if killed > 0:
                 logger.info("[%s] Killed %s worker processes during cleanup", execution_id, killed)
             logger.info("[%s] Execution cleanup complete", execution_id)
@@ -247,62 +502,61 @@ class ExecutionServer(ZMQServer, ABC):
     def _handle_status(self, msg):
         execution_id = StatusRequest.from_dict(msg).execution_id
         if execution_id:
-            if execution_id not in self.active_executions:
+            # One lookup: history eviction may drop the entry at any moment
+            record = self.active_executions.get(execution_id)
+            if record is None:
                 return ExecuteResponse(
                     ResponseType.ERROR,
                     error=f"Execution {execution_id} not found",
                 ).to_dict()
-            r = self.active_executions[execution_id]
-            return {
-                MessageFields.STATUS: ResponseType.OK.value,
-                "execution": {
-                    k: r.get(k)
-                    for k in [
-                        MessageFields.EXECUTION_ID,
-                        MessageFields.PLATE_ID,
-                        MessageFields.STATUS,
-                        MessageFields.START_TIME,
-                        MessageFields.END_TIME,
-                        MessageFields.ERROR,
-                        MessageFields.RESULTS_SUMMARY,
-                    ]
-                },
-            }
+            execution = record.to_dict()
+            del execution[MessageFields.CLIENT_ADDRESS]
+            return {MessageFields.STATUS: _OK, "execution": execution}
+        executions = self._snapshot_executions()
         return {
-            MessageFields.STATUS: ResponseType.OK.value,
-            MessageFields.ACTIVE_EXECUTIONS: len(self.active_executions),
-            MessageFields.UPTIME: time.time() - self.start_time if self.start_time else 0,
-            MessageFields.EXECUTIONS: list(self.active_executions.keys()),
+            MessageFields.STATUS: _OK,
+            MessageFields.ACTIVE_EXECUTIONS: len(executions),
+            MessageFields.UPTIME: self._uptime(),
+            MessageFields.EXECUTIONS: [eid for eid, _ in executions],
         }
 
     def _handle_cancel(self, msg):
         request, error = self._validate_and_parse(msg, CancelRequest)
         if error:
             return error
-        if request.execution_id not in self.active_executions:
+        record = self.active_executions.get(request.execution_id)
+        if record is None:
             return ExecuteResponse(
                 ResponseType.ERROR,
                 error=f"Execution {request.execution_id} not found",
             ).to_dict()
 
-        self._cancel_all_executions()
-        killed = self._kill_worker_processes()
+        if self.max_concurrent_executions > 1:
+            # Other executions are running alongside; leave them alone
+            self._cancel_execution(record, time.time())
+            killed = self._kill_worker_processes(request.execution_id)
+        else:
+            self._cancel_all_executions()
+            killed = self._kill_worker_processes()
         logger.info("[%s] Cancelled - killed %s workers", request.execution_id, killed)
         return {
-            MessageFields.STATUS: ResponseType.OK.value,
+            MessageFields.STATUS: _OK,
             MessageFields.MESSAGE: f"Cancelled - killed {killed} workers",
             MessageFields.WORKERS_KILLED: killed,
         }
 
     def _cancel_all_executions(self):
-        for eid, r in self.active_executions.items():
-            if r[MessageFields.STATUS] in (
-                ExecutionStatus.RUNNING.value,
-                ExecutionStatus.QUEUED.value,
-            ):
-                r[MessageFields.STATUS] = ExecutionStatus.CANCELLED.value
-                r[MessageFields.END_TIME] = time.time()
-                logger.info("[%s] Cancelled", eid)
+        now = time.time()
+        for eid in self._ids_with_status(ExecutionStatus.RUNNING, ExecutionStatus.QUEUED):
+            r = self.active_executions.get(eid)
+            if r is not None:
+                self._cancel_execution(r, now)
+
+    def _cancel_execution(self, record, now):
+        if not self._finish(record, _CANCELLED, end_time=now):
+            return
+        self.send_status_update(record.execution_id, _CANCELLED)
+        logger.info("[%s] Cancelled", record.execution_id)
 
     def _shutdown_workers(self, force=False):
         self._cancel_all_executions()
@@ -324,20 +578,39 @@ class ExecutionServer(ZMQServer, ABC):
         return self._shutdown_workers(force=True)
 
     def send_progress_update(self, well_id, step, status):
-        try:
-            self.progress_queue.put_nowait(
-                {
-                    "type": "progress",
-                    "well_id": well_id,
-                    "step": step,
-                    "status": status,
-                    "timestamp": time.time(),
-                }
-            )
-        except queue.Full:
-            logger.warning("Progress queue full, dropping %s", well_id)
+        update = ProgressUpdate(well_id=well_id, step=step, status=status, timestamp=time.time())
+        self.progress_queue.append(zmq.Frame(encode_data(update.to_dict())))
+
+    def send_status_update(self, execution_id, status):
+        """Publish an execution state change so waiting clients need not poll."""
+        message = {
+            "type": "status",
+            "execution_id": execution_id,
+            "status": status,
+            "timestamp": time.time(),
+        }
+        self.progress_queue.append(zmq.Frame(encode_data(message)))
+
+    def register_worker_pid(self, pid: int, execution_id: str | None = None):
+        """Track a worker process spawned by execute_task.
+
+        Once any worker is registered, worker info and cleanup only touch the
+        registered PIDs instead of scanning and string-matching every child.
+        Passing execution_id scopes cancel and cleanup to that execution,
+        which is required when max_concurrent_executions > 1.
+        """
+        self._worker_pids.add(pid)
+        if execution_id is not None:
+            self._execution_pids.setdefault(execution_id, set()).add(pid)
+
+    def unregister_worker_pid(self, pid: int):
+        self._worker_pids.discard(pid)
+        for pids in self._execution_pids.values():
+            pids.discard(pid)
 
     def _get_worker_info(self):
+        if self._worker_pids:
+            return self._get_tracked_worker_info()
         try:
             import psutil
 
@@ -369,8 +642,48 @@ class ExecutionServer(ZMQServer, ABC):
             logger.warning("Cannot get worker info: %s", e)
             return []
 
-    def _kill_worker_processes(self) -> int:
-        """Kill all worker processes and return the number killed."""
+    def _get_tracked_worker_info(self):
+        try:
+            import psutil
+        except ImportError:
+            return [{"pid": pid} for pid in self._worker_pids]
+        workers = []
+        for pid in list(self._worker_pids):
+            try:
+                proc = psutil.Process(pid)
+                with proc.oneshot():
+                    workers.append(
+                        {
+                            "pid": pid,
+                            "status": proc.status(),
+                            "cpu_percent": proc.cpu_percent(interval=0),
+                            "memory_mb": proc.memory_info().rss / 1024 / 1024,
+                            "create_time": proc.create_time(),
+                        }
+                    )
+            except psutil.NoSuchProcess:
+                self._worker_pids.discard(pid)
+            except psutil.AccessDenied:
+                pass
+        return workers
+
+    def _kill_worker_processes(self, execution_id: str | None = None) -> int:
+        """Kill worker processes and return the number killed.
+
+        With an execution_id only that execution's registered workers are
+        killed; without one, or when running one execution at a time, every
+        worker is.
+        """
+        if execution_id is not None:
+            pids = self._execution_pids.pop(execution_id, None)
+            if pids and os.name == "posix":
+                return self._kill_tracked_workers(pids)
+            if self.max_concurrent_executions > 1:
+                # Untagged workers cannot be attributed to this execution
+                return 0
+        if self._worker_pids and os.name == "posix":
+            self._execution_pids.clear()
+            return self._kill_tracked_workers()
         try:
             import psutil
 
@@ -430,6 +743,29 @@ class ExecutionServer(ZMQServer, ABC):
             logger.error("Failed to kill worker processes: %s", e, exc_info=True)
             return 0
 
+    def _kill_tracked_workers(self, pids=None, timeout: float = 3.0) -> int:
+        """SIGTERM the registered workers, escalating to SIGKILL after timeout."""
+        pids = list(self._worker_pids if pids is None else pids)
+        self._worker_pids.difference_update(pids)
+        alive = []
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                alive.append(pid)
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                logger.warning("Not permitted to kill worker PID %s", pid)
+        alive = _wait_for_exit(alive, timeout)
+        for pid in alive:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        _wait_for_exit(alive, 1.0)
+        logger.info("Killed %s tracked worker processes", len(pids))
+        return len(pids)
+
     @abstractmethod
     def execute_task(self, execution_id: str, request: ExecuteRequest) -> Any:
         """Execute a task. Subclass provides actual execution logic."""
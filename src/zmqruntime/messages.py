@@ -1,7 +1,7 @@
 """ZMQ Message Type System - enum dispatch and structured messages."""
 
 import logging
-from enum import Enum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -49,6 +49,11 @@ class MessageFields:
     SHAPES = "shapes"
     COORDINATES = "coordinates"
     METADATA = "metadata"
+    # Subscription handshake fields
+    TOKEN = "token"
+    SUBSCRIBED = "subscribed"
+    # Raw binary frames sent alongside a control message
+    PAYLOAD_FRAMES = "payload_frames"
 
 
 class ControlMessageType(Enum):
@@ -58,6 +63,7 @@ class ControlMessageType(Enum):
     CANCEL = "cancel"
     SHUTDOWN = "shutdown"
     FORCE_SHUTDOWN = "force_shutdown"
+    AWAIT_SUBSCRIPTION = "await_subscription"
 
     def get_handler_method(self):
         return {
@@ -78,6 +84,7 @@ class ResponseType(Enum):
     OK = "ok"
     ERROR = "error"
     SHUTDOWN_ACK = "shutdown_ack"
+    SUBSCRIPTION_ACK = "subscription_ack"
 
 
 class ExecutionStatus(Enum):
@@ -90,22 +97,40 @@ class ExecutionStatus(Enum):
     ACCEPTED = "accepted"
 
 
+class ViewerType(IntEnum):
+    """Compact wire code for the built-in viewer types carried in acks."""
+    NAPARI = 0
+    FIJI = 1
+
+    @classmethod
+    def encode(cls, viewer_type):
+        """Return the int code for a known viewer type, else the name unchanged."""
+        member = cls.__members__.get(viewer_type.upper()) if isinstance(viewer_type, str) else None
+        return viewer_type if member is None else member.value
+
+    @classmethod
+    def decode(cls, value):
+        """Return the viewer type name for a wire value (int code or name)."""
+        return cls(value).name.lower() if isinstance(value, int) else value
+
+
 class SocketType(Enum):
     PUB = "PUB"
     SUB = "SUB"
+    XPUB = "XPUB"
     REQ = "REQ"
     REP = "REP"
 
     @classmethod
     def from_zmq_constant(cls, zmq_const):
         import zmq
-        return {zmq.PUB: cls.PUB, zmq.SUB: cls.SUB, zmq.REQ: cls.REQ, zmq.REP: cls.REP}.get(zmq_const, cls.PUB)
+        return {zmq.PUB: cls.PUB, zmq.SUB: cls.SUB, zmq.XPUB: cls.XPUB, zmq.REQ: cls.REQ, zmq.REP: cls.REP}.get(zmq_const, cls.PUB)
 
     def get_display_name(self):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecuteRequest:
     plate_id: str
     pipeline_code: str
@@ -113,6 +138,7 @@ class ExecuteRequest:
     config_code: str = None
     pipeline_config_code: str = None
     client_address: str = None
+    payload_frames: list = None  # Extra multipart frames; not part of to_dict()
 
     def validate(self):
         if not self.plate_id:
@@ -139,10 +165,11 @@ class ExecuteRequest:
     def from_dict(cls, data):
         return cls(plate_id=data[MessageFields.PLATE_ID], pipeline_code=data[MessageFields.PIPELINE_CODE],
                   config_params=data.get(MessageFields.CONFIG_PARAMS), config_code=data.get(MessageFields.CONFIG_CODE),
-                  pipeline_config_code=data.get(MessageFields.PIPELINE_CONFIG_CODE), client_address=data.get(MessageFields.CLIENT_ADDRESS))
+                  pipeline_config_code=data.get(MessageFields.PIPELINE_CONFIG_CODE), client_address=data.get(MessageFields.CLIENT_ADDRESS),
+                  payload_frames=data.get(MessageFields.PAYLOAD_FRAMES))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecuteResponse:
     status: ResponseType
     execution_id: str = None
@@ -160,10 +187,13 @@ class ExecuteResponse:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusRequest:
     execution_id: str = None
 
+    def validate(self):
+        return None
+
     def to_dict(self):
         result = {MessageFields.TYPE: ControlMessageType.STATUS.value}
         if self.execution_id is not None:
@@ -175,7 +205,7 @@ class StatusRequest:
         return cls(execution_id=data.get(MessageFields.EXECUTION_ID))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CancelRequest:
     execution_id: str
 
@@ -190,7 +220,7 @@ class CancelRequest:
         return cls(execution_id=data[MessageFields.EXECUTION_ID])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PongResponse:
     port: int
     control_port: int
@@ -218,7 +248,59 @@ class PongResponse:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class ExecutionRecord:
+    """Server-side state of one execution.
+
+    Fields are attributes; item access by MessageFields name (record["status"])
+    is kept for code written against the earlier dict records. Status is
+    read-only through item access: the server indexes records by status, so
+    changes must go through ExecutionServer._set_status.
+    """
+    execution_id: str
+    plate_id: str
+    client_address: str = None
+    status: str = ExecutionStatus.QUEUED.value
+    start_time: float = None
+    end_time: float = None
+    error: str = None
+    results_summary: dict = None
+    orchestrator: object = None  # Set by subclasses while running; never serialized
+
+    def to_dict(self):
+        return {MessageFields.EXECUTION_ID: self.execution_id, MessageFields.PLATE_ID: self.plate_id,
+                MessageFields.CLIENT_ADDRESS: self.client_address, MessageFields.STATUS: self.status,
+                MessageFields.START_TIME: self.start_time, MessageFields.END_TIME: self.end_time,
+                MessageFields.ERROR: self.error, MessageFields.RESULTS_SUMMARY: self.results_summary}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key == MessageFields.STATUS:
+            raise TypeError("ExecutionRecord status is read-only here; use ExecutionServer._set_status()")
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def pop(self, key, default=None):
+        if key == MessageFields.STATUS:
+            raise TypeError("ExecutionRecord status is read-only here; use ExecutionServer._set_status()")
+        if key not in self.__slots__:
+            return default
+        value = getattr(self, key)
+        setattr(self, key, None)
+        return value
+
+
+@dataclass(frozen=True, slots=True)
 class ProgressUpdate:
     well_id: str
     step: str
@@ -230,7 +312,7 @@ class ProgressUpdate:
                 MessageFields.STEP: self.step, MessageFields.STATUS: self.status, MessageFields.TIMESTAMP: self.timestamp}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageAck:
     """Acknowledgment message sent by viewers after processing an image.
 
@@ -263,13 +345,13 @@ class ImageAck:
         return cls(
             image_id=data[MessageFields.IMAGE_ID],
             viewer_port=data[MessageFields.VIEWER_PORT],
-            viewer_type=data[MessageFields.VIEWER_TYPE],
+            viewer_type=ViewerType.decode(data[MessageFields.VIEWER_TYPE]),
             status=data.get(MessageFields.STATUS, 'success'),
             timestamp=data.get(MessageFields.TIMESTAMP),
             error=data.get(MessageFields.ERROR)
         )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ROIMessage:
     """Message for streaming ROIs to viewers (Napari/Fiji).
 
@@ -293,7 +375,7 @@ class ROIMessage:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShapesMessage:
     """Message for Napari shapes layer.
 
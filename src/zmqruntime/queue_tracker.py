@@ -5,9 +5,11 @@ Used to show real-time progress like '3/10 images processed' in the UI.
 """
 
 import logging
+import os
 import threading
 import time
-from typing import Dict, Tuple, Optional, Set
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +18,8 @@ class QueueTracker:
     """Tracks pending images for a single viewer.
     
     Thread-safe tracker that maintains:
-    - Set of sent image IDs (pending processing)
-    - Set of processed image IDs (received acks)
+    - Sent image IDs pending processing, in send order
+    - Sent and processed counts
     - Timestamps for timeout detection
     """
     
@@ -34,21 +36,31 @@ class QueueTracker:
         self.timeout_seconds = timeout_seconds
         
         self._lock = threading.Lock()
-        self._pending: Dict[str, float] = {}  # {image_id: timestamp_sent}
-        self._processed: Set[str] = set()     # {image_id}
+        # {image_id: time.monotonic() when sent}, oldest first
+        self._pending: OrderedDict[str, float] = OrderedDict()
         self._total_sent = 0
         self._total_processed = 0
     
-    def register_sent(self, image_id: str):
+    def register_sent(self, image_id: str, now: Optional[float] = None):
         """Register that an image was sent to the viewer.
         
         Args:
             image_id: UUID of the sent image
+            now: time.monotonic() timestamp to record; pass one shared value
+                when registering a batch of images sent together
         """
+        if now is None:
+            now = time.monotonic()
         with self._lock:
-            self._pending[image_id] = time.time()
+            self._pending[image_id] = now
+            # A resent image moves to the back, keeping the dict in send order
+            self._pending.move_to_end(image_id)
             self._total_sent += 1
-            logger.debug(f"[{self.viewer_type}:{self.viewer_port}] Registered sent image {image_id} (pending: {len(self._pending)})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[%s:%s] Registered sent image %s (pending: %d)",
+                    self.viewer_type, self.viewer_port, image_id, len(self._pending),
+                )
     
     def mark_processed(self, image_id: str):
         """Mark an image as processed (ack received).
@@ -57,34 +69,42 @@ class QueueTracker:
             image_id: UUID of the processed image
         """
         with self._lock:
-            if image_id in self._pending:
-                elapsed = time.time() - self._pending[image_id]
-                del self._pending[image_id]
-                self._processed.add(image_id)
+            sent_time = self._pending.pop(image_id, None)
+            if sent_time is not None:
                 self._total_processed += 1
-                logger.debug(f"[{self.viewer_type}:{self.viewer_port}] Marked processed {image_id} (took {elapsed:.2f}s, pending: {len(self._pending)})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[%s:%s] Marked processed %s (took %.2fs, pending: %d)",
+                        self.viewer_type, self.viewer_port, image_id,
+                        time.monotonic() - sent_time, len(self._pending),
+                    )
 
                 # Log when all images are processed (but don't auto-clear)
                 # The UI needs to read the final progress before the tracker is cleared
                 if len(self._pending) == 0 and self._total_sent > 0:
-                    logger.info(f"[{self.viewer_type}:{self.viewer_port}] All {self._total_sent} images processed")
+                    logger.info("[%s:%s] All %d images processed", self.viewer_type, self.viewer_port, self._total_sent)
             else:
                 # Image was not registered (likely sent from worker process with separate registry)
-                # Still count it as processed so UI can track progress
-                if image_id not in self._processed:
-                    self._processed.add(image_id)
-                    self._total_processed += 1
-                    self._total_sent += 1  # Retroactively count as sent
-                    logger.debug(f"[{self.viewer_type}:{self.viewer_port}] Received ack for unregistered image {image_id}, counted retroactively (processed: {self._total_processed}/{self._total_sent})")
+                # Still count it as processed so UI can track progress.
+                # Duplicate acks are not filtered here; senders ack once.
+                # Sent first so lock-free readers never see processed > sent
+                self._total_sent += 1  # Retroactively count as sent
+                self._total_processed += 1
+                logger.debug(
+                    "[%s:%s] Received ack for unregistered image %s, counted retroactively (processed: %d/%d)",
+                    self.viewer_type, self.viewer_port, image_id, self._total_processed, self._total_sent,
+                )
     
     def get_progress(self) -> Tuple[int, int]:
         """Get current progress.
-        
+
+        Lock-free: the counters are only written under the lock and reading
+        an int attribute is atomic, so UI polling never waits on ack traffic.
+
         Returns:
             (processed_count, total_sent_count)
         """
-        with self._lock:
-            return (self._total_processed, self._total_sent)
+        return (self._total_processed, self._total_sent)
     
     def get_pending_count(self) -> int:
         """Get number of pending images (sent but not acked).
@@ -92,8 +112,7 @@ class QueueTracker:
         Returns:
             Number of pending images
         """
-        with self._lock:
-            return len(self._pending)
+        return len(self._pending)
     
     def has_stuck_images(self) -> bool:
         """Check if any images have been pending longer than timeout.
@@ -102,11 +121,10 @@ class QueueTracker:
             True if any images are stuck (no ack within timeout)
         """
         with self._lock:
-            now = time.time()
-            for image_id, sent_time in self._pending.items():
-                if now - sent_time > self.timeout_seconds:
-                    return True
-            return False
+            if not self._pending:
+                return False
+            oldest_sent = next(iter(self._pending.values()))
+            return time.monotonic() - oldest_sent > self.timeout_seconds
     
     def get_stuck_images(self) -> list:
         """Get list of stuck image IDs (pending longer than timeout).
@@ -115,65 +133,85 @@ class QueueTracker:
             List of (image_id, elapsed_seconds) tuples
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             stuck = []
+            # Oldest first, so only the stuck prefix is visited
             for image_id, sent_time in self._pending.items():
                 elapsed = now - sent_time
-                if elapsed > self.timeout_seconds:
-                    stuck.append((image_id, elapsed))
+                if elapsed <= self.timeout_seconds:
+                    break
+                stuck.append((image_id, elapsed))
             return stuck
     
     def clear(self):
         """Clear all tracking data (e.g., when viewer is closed)."""
         with self._lock:
             self._pending.clear()
-            self._processed.clear()
             self._total_sent = 0
             self._total_processed = 0
-            logger.debug(f"[{self.viewer_type}:{self.viewer_port}] Cleared queue tracker")
+            logger.debug("[%s:%s] Cleared queue tracker", self.viewer_type, self.viewer_port)
 
     def reset_for_new_batch(self):
         """Reset tracker for a new batch of images (e.g., new pipeline execution).
 
-        Clears pending and processed sets but preserves the tracker for reuse.
+        Clears pending images and counts but preserves the tracker for reuse.
         """
         with self._lock:
             self._pending.clear()
-            self._processed.clear()
             self._total_sent = 0
             self._total_processed = 0
-            logger.debug(f"[{self.viewer_type}:{self.viewer_port}] Reset queue tracker for new batch")
+            logger.debug("[%s:%s] Reset queue tracker for new batch", self.viewer_type, self.viewer_port)
     
     def __repr__(self):
         with self._lock:
             return f"QueueTracker({self.viewer_type}:{self.viewer_port}, processed={self._total_processed}/{self._total_sent}, pending={len(self._pending)})"
 
 
+class _Shard:
+    """One lock-striped partition of the tracker registry.
+
+    trackers is copy-on-write: writers build a new dict under the lock and
+    rebind it, so readers can use whichever dict they load without locking.
+    """
+
+    __slots__ = ("lock", "trackers")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.trackers: Dict[int, QueueTracker] = {}
+
+
 class GlobalQueueTrackerRegistry:
     """Global registry of queue trackers for all viewers.
     
-    Singleton that maintains queue trackers for each active viewer.
-    Used by the ack listener to route acks to the correct tracker.
+    Maintains queue trackers for each active viewer. The process-wide
+    instance is GLOBAL_QUEUE_TRACKER_REGISTRY; the ack listener uses it to
+    route acks to the correct tracker, and calling the class returns it too.
+    Trackers are striped across shards by viewer port so that acks for
+    different viewers never contend on the same lock.
     """
     
     _instance = None
-    _lock = threading.Lock()
-    
+
     def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
+        # Calling the class still returns the shared registry the ack listener
+        # routes to. It is first built at import, so no lock is needed here.
+        if GlobalQueueTrackerRegistry._instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            GlobalQueueTrackerRegistry._instance = instance
+        return GlobalQueueTrackerRegistry._instance
+
     def __init__(self):
         if self._initialized:
             return
         self._initialized = True
-        self._trackers: Dict[int, QueueTracker] = {}  # {viewer_port: QueueTracker}
-        self._registry_lock = threading.Lock()
+        self._shard_count = 4 * (os.cpu_count() or 1)
+        self._shards = [_Shard() for _ in range(self._shard_count)]
         logger.info("Initialized GlobalQueueTrackerRegistry")
+
+    def _shard(self, viewer_port: int) -> _Shard:
+        return self._shards[viewer_port % self._shard_count]
     
     def get_or_create_tracker(self, viewer_port: int, viewer_type: str) -> QueueTracker:
         """Get existing tracker or create new one for a viewer.
@@ -185,11 +223,14 @@ class GlobalQueueTrackerRegistry:
         Returns:
             QueueTracker for this viewer
         """
-        with self._registry_lock:
-            if viewer_port not in self._trackers:
-                self._trackers[viewer_port] = QueueTracker(viewer_port, viewer_type)
-                logger.info(f"Created queue tracker for {viewer_type} viewer on port {viewer_port}")
-            return self._trackers[viewer_port]
+        shard = self._shard(viewer_port)
+        with shard.lock:
+            tracker = shard.trackers.get(viewer_port)
+            if tracker is None:
+                tracker = QueueTracker(viewer_port, viewer_type)
+                shard.trackers = {**shard.trackers, viewer_port: tracker}
+                logger.info("Created queue tracker for %s viewer on port %s", viewer_type, viewer_port)
+            return tracker
     
     def get_tracker(self, viewer_port: int) -> Optional[QueueTracker]:
         """Get tracker for a viewer port.
@@ -200,8 +241,8 @@ class GlobalQueueTrackerRegistry:
         Returns:
             QueueTracker if exists, None otherwise
         """
-        with self._registry_lock:
-            return self._trackers.get(viewer_port)
+        # The shard dict is never mutated once published, so no lock is needed
+        return self._shard(viewer_port).trackers.get(viewer_port)
     
     def remove_tracker(self, viewer_port: int):
         """Remove tracker for a viewer (e.g., when viewer is closed).
@@ -209,10 +250,13 @@ class GlobalQueueTrackerRegistry:
         Args:
             viewer_port: Port of the viewer
         """
-        with self._registry_lock:
-            if viewer_port in self._trackers:
-                del self._trackers[viewer_port]
-                logger.info(f"Removed queue tracker for viewer on port {viewer_port}")
+        shard = self._shard(viewer_port)
+        with shard.lock:
+            if viewer_port in shard.trackers:
+                trackers = dict(shard.trackers)
+                del trackers[viewer_port]
+                shard.trackers = trackers
+                logger.info("Removed queue tracker for viewer on port %s", viewer_port)
     
     def get_all_trackers(self) -> Dict[int, QueueTracker]:
         """Get all active trackers.
@@ -220,12 +264,18 @@ class GlobalQueueTrackerRegistry:
         Returns:
             Dict of {viewer_port: QueueTracker}
         """
-        with self._registry_lock:
-            return dict(self._trackers)
+        trackers = {}
+        for shard in self._shards:
+            trackers.update(shard.trackers)
+        return trackers
     
     def clear_all(self):
         """Clear all trackers (e.g., on shutdown)."""
-        with self._registry_lock:
-            self._trackers.clear()
-            logger.info("Cleared all queue trackers")
+        for shard in self._shards:
+            with shard.lock:
+                shard.trackers = {}
+        logger.info("Cleared all queue trackers")
+
 
+# Created once at import; GlobalQueueTrackerRegistry() returns this same object
+GLOBAL_QUEUE_TRACKER_REGISTRY = GlobalQueueTrackerRegistry()
@@ -1,20 +1,25 @@
 """ZMQ server base class and utilities."""
 from __future__ import annotations
 
+import ctypes
+import itertools
 import logging
+import operator
 import os
 import platform
-import pickle
+import signal
 import socket
 import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod, ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import zmq
 
+from zmqruntime.codec import decode_control_request, encode_control
 from zmqruntime.config import TransportMode, ZMQConfig
 from zmqruntime.messages import (
     ControlMessageType,
@@ -32,6 +37,65 @@ from zmqruntime.transport import (
 
 logger = logging.getLogger(__name__)
 
+_CONTROL_WORKER_POLL_MS = 100
+_inproc_ids = itertools.count()
+# Sockets on the shared context close asynchronously, so a server restarted
+# on the same port may briefly find the old listener still bound.
+_REBIND_TIMEOUT_S = 1.0
+
+
+def _bind(sock, url):
+    deadline = time.monotonic() + _REBIND_TIMEOUT_S
+    while True:
+        try:
+            sock.bind(url)
+            return
+        except zmq.ZMQError as e:
+            if e.errno != zmq.EADDRINUSE or time.monotonic() >= deadline:
+                raise
+            time.sleep(0.005)
+
+
+_shm_loader_executor: ThreadPoolExecutor | None = None
+_shm_loader_lock = threading.Lock()
+
+
+def _shm_loader_pool() -> ThreadPoolExecutor:
+    """Shared pool for mapping shared memory images, created on first use."""
+    global _shm_loader_executor
+    if _shm_loader_executor is None:
+        with _shm_loader_lock:
+            if _shm_loader_executor is None:
+                _shm_loader_executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) + 4),
+                    thread_name_prefix="shm-loader",
+                )
+    return _shm_loader_executor
+
+
+class _SharedMemoryImage:
+    """Array interface over a shared memory block that keeps it mapped.
+
+    numpy keeps the interface object as the array's base, so the block stays
+    mapped exactly as long as the array (or any view of it) is alive, and is
+    closed by SharedMemory.__del__ once the last view goes away.
+    """
+
+    __slots__ = ("_shm", "__array_interface__")
+
+    def __init__(self, shm, shape, dtype):
+        self._shm = shm
+        # Only the address is needed; dropping the ctypes view straight away
+        # releases its buffer export so shm can close cleanly later.
+        address = ctypes.addressof(ctypes.c_char.from_buffer(shm.buf))
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": dtype.str,
+            "descr": dtype.descr,
+            "data": (address, False),
+            "version": 3,
+        }
+
 
 try:
     from metaclass_registry import AutoRegisterMeta  # type: ignore
@@ -71,6 +135,10 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
 
     _server_type: Optional[str] = None  # Override in subclasses for registration
 
+    # Number of threads that handle control messages behind a ROUTER/DEALER
+    # proxy. 0 keeps control handling inside process_messages.
+    control_worker_threads = 0
+
     def __init__(
         self,
         port: int,
@@ -80,14 +148,14 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
         transport_mode: TransportMode | None = None,
         config: ZMQConfig | None = None,
     ):
-        import zmq
-
         self.config = config or ZMQConfig()
         self.port = port
         self.host = host
         self.control_port = port + self.config.control_port_offset
         self.log_file_path = log_file_path
-        self.data_socket_type = data_socket_type if data_socket_type is not None else zmq.PUB
+        # XPUB behaves like PUB but reports subscriptions, which lets clients
+        # confirm their SUB socket is attached instead of sleeping after connect
+        self.data_socket_type = data_socket_type if data_socket_type is not None else zmq.XPUB
         # Windows doesn't support IPC (POSIX named pipes), so use TCP with localhost
         self.transport_mode = transport_mode or get_default_transport_mode()
         self.zmq_context = None
@@ -96,12 +164,27 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
         self._running = False
         self._ready = False
         self._lock = threading.Lock()
+        self._subscription_tokens: set[bytes] = set()
+        self._proxy_thread: threading.Thread | None = None
+        self._proxy_control = None
+        self._control_workers: list[threading.Thread] = []
+        # Sockets process_messages services, polled together without blocking
+        self._poller: zmq.Poller | None = None
+        # Serialized pongs keyed by the ready flag. Only used when the pong is
+        # the static base one; subclasses reporting live state rebuild it.
+        self._pong_bytes: dict[bool, bytes] = {}
+        self._pong_cacheable = type(self)._create_pong_response is ZMQServer._create_pong_response
 
     def start(self):
+        # Unlocked fast path for redundant calls; re-checked under the lock
+        if self._running:
+            return
         with self._lock:
             if self._running:
                 return
-            self.zmq_context = zmq.Context()
+            # Shared with every other server (and the ack socket) in this
+            # process, so N servers run on one IO thread
+            self.zmq_context = zmq.Context.instance()
             self.data_socket = self.zmq_context.socket(self.data_socket_type)
             self.data_socket.setsockopt(zmq.LINGER, 0)
 
@@ -127,13 +210,27 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
                 config=self.config,
             )
 
-            self.data_socket.bind(data_url)
+            if self.data_socket_type == zmq.XPUB:
+                # Pass every (un)subscribe through, not just the first per topic
+                self.data_socket.setsockopt(zmq.XPUB_VERBOSE, 1)
+            _bind(self.data_socket, data_url)
             if self.data_socket_type == zmq.SUB:
                 self.data_socket.setsockopt(zmq.SUBSCRIBE, b"")
-            self.control_socket = self.zmq_context.socket(zmq.REP)
+            if self.control_worker_threads > 0:
+                self.control_socket = self.zmq_context.socket(zmq.ROUTER)
+            else:
+                self.control_socket = self.zmq_context.socket(zmq.REP)
             self.control_socket.setsockopt(zmq.LINGER, 0)
-            self.control_socket.bind(control_url)
+            _bind(self.control_socket, control_url)
             self._running = True
+            poller = zmq.Poller()
+            if self.data_socket_type == zmq.XPUB:
+                poller.register(self.data_socket, zmq.POLLIN)
+            if self.control_worker_threads > 0:
+                self._start_control_workers()
+            else:
+                poller.register(self.control_socket, zmq.POLLIN)
+            self._poller = poller
             logger.info(
                 "ZMQ Server started on %s (%s), control %s",
                 data_url,
@@ -142,40 +239,143 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
             )
 
     def stop(self):
+        if not self._running:
+            return
         with self._lock:
             if not self._running:
                 return
             self._running = False
+            self._poller = None
+            self._stop_control_workers()
             if self.data_socket:
                 self.data_socket.close()
                 self.data_socket = None
             if self.control_socket:
                 self.control_socket.close()
                 self.control_socket = None
-            if self.zmq_context:
-                self.zmq_context.term()
-                self.zmq_context = None
+            # The context is process-wide and only terminated at exit
+            self.zmq_context = None
             logger.info("ZMQ Server stopped")
 
     def is_running(self):
         return self._running
 
+    def _start_control_workers(self):
+        """Put control handling on worker threads behind a ROUTER/DEALER proxy.
+
+        The proxy shuttles requests between the bound ROUTER and an inproc
+        DEALER in C; each worker owns a REP socket on the DEALER side, so slow
+        handlers no longer hold up the thread that calls process_messages.
+        """
+        # The context is shared, so inproc names must be unique per start
+        backend_url = f"inproc://zmqruntime-control-{id(self):x}-{next(_inproc_ids)}"
+        steer_url = f"{backend_url}-steer"
+        backend = self.zmq_context.socket(zmq.DEALER)
+        backend.setsockopt(zmq.LINGER, 0)
+        backend.bind(backend_url)
+        steer = self.zmq_context.socket(zmq.PAIR)
+        steer.setsockopt(zmq.LINGER, 0)
+        steer.bind(steer_url)
+        self._proxy_control = self.zmq_context.socket(zmq.PAIR)
+        self._proxy_control.setsockopt(zmq.LINGER, 0)
+        self._proxy_control.connect(steer_url)
+        frontend = self.control_socket
+
+        def run_proxy():
+            try:
+                zmq.proxy_steerable(frontend, backend, None, steer)
+            except zmq.ZMQError as e:
+                logger.debug("Control proxy exited: %s", e)
+            finally:
+                backend.close()
+                steer.close()
+
+        self._proxy_thread = threading.Thread(target=run_proxy, daemon=True, name="ControlProxy")
+        self._proxy_thread.start()
+        self._control_workers = [
+            threading.Thread(
+                target=self._control_worker_loop,
+                args=(backend_url,),
+                daemon=True,
+                name=f"ControlWorker-{i}",
+            )
+            for i in range(self.control_worker_threads)
+        ]
+        for worker in self._control_workers:
+            worker.start()
+        logger.info("Started %s control worker thread(s)", self.control_worker_threads)
+
+    def _stop_control_workers(self):
+        for worker in self._control_workers:
+            worker.join(timeout=2)
+        self._control_workers = []
+        if self._proxy_thread is not None:
+            self._proxy_control.send(b"TERMINATE")
+            self._proxy_thread.join(timeout=2)
+            self._proxy_control.close()
+            self._proxy_control = None
+            self._proxy_thread = None
+
+    def _control_worker_loop(self, backend_url):
+        sock = self.zmq_context.socket(zmq.REP)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.connect(backend_url)
+        poller = zmq.Poller()
+        poller.register(sock, zmq.POLLIN)
+        try:
+            while self._running:
+                # Poll timeout is in milliseconds; it bounds how long stop() waits
+                if not poller.poll(_CONTROL_WORKER_POLL_MS):
+                    continue
+                frames = sock.recv_multipart(copy=False)
+                try:
+                    self._reply_to_control_request(sock, frames)
+                except Exception as e:
+                    # One bad message must not take the worker down with it
+                    logger.error("Control worker failed to handle a message: %s", e, exc_info=True)
+        except zmq.ZMQError as e:
+            if self._running:
+                logger.error("Control worker error: %s", e, exc_info=True)
+        finally:
+            sock.close()
+
     def process_messages(self):
-        if not self._running:
+        poller = self._poller
+        if not self._running or poller is None:
             return
 
-        # CRITICAL: ZMQ REP sockets require strict recv->send alternation.
-        try:
-            control_data = pickle.loads(self.control_socket.recv(zmq.NOBLOCK))
-        except zmq.Again:
+        # One zero-timeout poll covers both sockets, so an idle call raises
+        # no zmq.Again
+        events = dict(poller.poll(0))
+        if not events:
             return
-
+        if self.data_socket in events:
+            self._drain_subscriptions()
+        if self.control_socket in events:
+            # CRITICAL: ZMQ REP sockets require strict recv->send alternation.
+            frames = self.control_socket.recv_multipart(zmq.NOBLOCK, copy=False)
+            self._reply_to_control_request(self.control_socket, frames)
+
+    def _reply_to_control_request(self, sock, frames):
+        """Decode a control request, dispatch it and send the reply on sock."""
+        # Everything up to the send is guarded: a REP socket that never
+        # replies is wedged, so even an undecodable frame gets an error reply.
         try:
-            if control_data.get(MessageFields.TYPE) == ControlMessageType.PING.value:
+            control_data = decode_control_request(frames[0].buffer)
+            if len(frames) > 1:
+                # Binary payloads ride as extra frames and are handed over zero-copy
+                control_data[MessageFields.PAYLOAD_FRAMES] = [frame.buffer for frame in frames[1:]]
+            message_type = control_data.get(MessageFields.TYPE)
+            if message_type == ControlMessageType.PING.value:
                 if not self._ready:
                     self._ready = True
                     logger.info("Server ready")
+                if self._pong_cacheable:
+                    self._send_control_reply(sock, self._cached_pong_bytes())
+                    return
                 response = self._create_pong_response()
+            elif message_type == ControlMessageType.AWAIT_SUBSCRIPTION.value:
+                response = self._create_subscription_ack(control_data)
             else:
                 response = self.handle_control_message(control_data)
         except Exception as e:
@@ -183,10 +383,57 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
             response = {"status": "error", "message": str(e), "type": "error"}
 
         try:
-            self.control_socket.send(pickle.dumps(response))
+            payload = encode_control(response)
+        except Exception as e:
+            logger.error("Could not encode control reply: %s", e, exc_info=True)
+            payload = encode_control({"status": "error", "message": str(e), "type": "error"})
+        self._send_control_reply(sock, payload)
+
+    def _send_control_reply(self, sock, payload):
+        try:
+            sock.send(payload, copy=False)
         except Exception as e:
             logger.error("Failed to send response on control socket: %s", e, exc_info=True)
 
+    def _cached_pong_bytes(self):
+        ready = self._ready
+        payload = self._pong_bytes.get(ready)
+        if payload is None:
+            payload = self._pong_bytes[ready] = encode_control(self._create_pong_response())
+        return payload
+
+    def _drain_subscriptions(self):
+        """Record subscription tokens reported by the XPUB data socket."""
+        sock = self.data_socket
+        while sock.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+            frame = sock.recv(zmq.NOBLOCK)
+            if not frame:
+                continue
+            # XPUB frames are a 1 (subscribe) or 0 (unsubscribe) byte plus the topic
+            if frame[0] == 1:
+                self._subscription_tokens.add(frame[1:])
+            else:
+                self._subscription_tokens.discard(frame[1:])
+
+    def _create_subscription_ack(self, message):
+        if self.data_socket_type != zmq.XPUB:
+            # Only XPUB reports subscriptions. A non-ack reply sends the client
+            # down its fixed-delay path instead of polling until it times out.
+            return {
+                MessageFields.TYPE: ResponseType.ERROR.value,
+                MessageFields.STATUS: ResponseType.ERROR.value,
+                MessageFields.MESSAGE: "Subscription handshake needs an XPUB data socket",
+            }
+        token = message.get(MessageFields.TOKEN) or ""
+        # Control workers must not touch the data socket; the loop in
+        # process_messages drains it for them and the client retries.
+        if not self._control_workers:
+            self._drain_subscriptions()
+        return {
+            MessageFields.TYPE: ResponseType.SUBSCRIPTION_ACK.value,
+            MessageFields.SUBSCRIBED: token.encode() in self._subscription_tokens,
+        }
+
     def _create_pong_response(self):
         return (
             PongResponse(
@@ -224,23 +471,32 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
                     timeout=2,
                 )
                 if result.returncode == 0 and result.stdout.strip():
-                    for pid in result.stdout.strip().split("\n"):
+                    # Signal directly rather than forking one kill per PID
+                    for pid in result.stdout.split():
                         try:
-                            subprocess.run(["kill", "-9", pid], timeout=1)
+                            os.kill(int(pid), signal.SIGKILL)
                             killed += 1
-                        except Exception:
+                        except (ValueError, OSError):
                             pass
             elif system == "Windows":
                 result = subprocess.run(
                     ["netstat", "-ano"], capture_output=True, text=True, timeout=2
                 )
-                for line in result.stdout.split("\n"):
-                    if f":{port}" in line and "LISTENING" in line:
-                        try:
-                            subprocess.run(["taskkill", "/PID", line.split()[-1]], timeout=1)
-                            killed += 1
-                        except Exception:
-                            pass
+                pids = {
+                    line.split()[-1]
+                    for line in result.stdout.split("\n")
+                    if f":{port}" in line and "LISTENING" in line
+                }
+                if pids:
+                    # One taskkill for every listener instead of one per PID
+                    args = ["taskkill"]
+                    for pid in pids:
+                        args += ["/PID", pid]
+                    try:
+                        subprocess.run(args, timeout=2)
+                        killed = len(pids)
+                    except Exception:
+                        pass
         except Exception:
             pass
         return killed
@@ -251,28 +507,37 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
         import numpy as np
         from multiprocessing import shared_memory
 
-        image_data_list = []
-        for image_info in images:
+        def load_one(image_info):
             shm_name = image_info.get("shm_name")
-            shape = tuple(image_info.get("shape"))
-            dtype = np.dtype(image_info.get("dtype"))
-            metadata = image_info.get("metadata", {})
-            image_id = image_info.get("image_id")
-
             try:
                 shm = shared_memory.SharedMemory(name=shm_name)
-                np_data = np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
-                shm.close()
+                # Map the block in place instead of copying it out. Unlinking
+                # only removes the name; the mapping lives on with the array.
+                shape = tuple(image_info.get("shape"))
+                dtype = np.dtype(image_info.get("dtype"))
+                np_data = np.asarray(_SharedMemoryImage(shm, shape, dtype))
                 shm.unlink()
-
-                image_data_list.append(
-                    {"data": np_data, "metadata": metadata, "image_id": image_id}
-                )
+                return np_data, None
             except Exception as e:
-                logger.error("Failed to read shared memory %s: %s", shm_name, e)
+                return None, e
+
+        if len(images) > 1:
+            # Opening and mapping a block is syscall-bound and releases the GIL
+            results = list(_shm_loader_pool().map(load_one, images))
+        else:
+            results = [load_one(image_info) for image_info in images]
+
+        image_data_list = []
+        for image_info, (np_data, error) in zip(images, results):
+            image_id = image_info.get("image_id")
+            if error is not None:
+                logger.error("Failed to read shared memory %s: %s", image_info.get("shm_name"), error)
                 if error_callback and image_id:
-                    error_callback(image_id, "error", f"Failed to read shared memory: {e}")
+                    error_callback(image_id, "error", f"Failed to read shared memory: {error}")
                 continue
+            image_data_list.append(
+                {"data": np_data, "metadata": image_info.get("metadata", {}), "image_id": image_id}
+            )
 
         return image_data_list
 
@@ -282,11 +547,13 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
         if not components:
             return [()]
 
-        values = set()
-        for img_data in images:
-            meta = img_data["metadata"]
-            value_tuple = tuple(meta[comp] for comp in components)
-            values.add(value_tuple)
+        # itemgetter does the per-component lookups in C; with a single
+        # component it returns the bare value, so wrap it to keep tuples.
+        getter = operator.itemgetter(*components)
+        if len(components) == 1:
+            values = {(getter(img_data["metadata"]),) for img_data in images}
+        else:
+            values = {getter(img_data["metadata"]) for img_data in images}
 
         return sorted(values)
 
@@ -300,14 +567,15 @@ class ZMQServer(ABC, metaclass=AutoRegisterMeta):
     ):
         """Organize components by their display mode."""
         result = {"window": [], "channel": [], "slice": [], "frame": []}
+        # Components without recorded values count as flat, so track the
+        # varying ones rather than the flat ones.
+        varying = {comp for comp, values in component_unique_values.items() if len(values) > 1}
 
         for comp_name in component_order:
             mode = component_modes[comp_name]
-            is_flat = len(component_unique_values.get(comp_name, set())) <= 1
-
             if mode == "window":
                 result["window"].append(comp_name)
-            elif skip_flat_dimensions and is_flat:
+            elif skip_flat_dimensions and comp_name not in varying:
                 continue
             else:
                 result[mode].append(comp_name)
@@ -1,7 +1,6 @@
 """Streaming visualizer server base class."""
 from __future__ import annotations
 
-import json
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -9,8 +8,9 @@ from typing import Any
 
 import zmq
 
+from zmqruntime.codec import decode_json, encode_data
 from zmqruntime.config import TransportMode, ZMQConfig
-from zmqruntime.messages import ImageAck
+from zmqruntime.messages import MessageFields, ViewerType
 from zmqruntime.server import ZMQServer
 from zmqruntime.transport import get_zmq_transport_url
 
@@ -41,6 +41,13 @@ class StreamingVisualizerServer(ZMQServer, ABC):
         )
         self.viewer_type = viewer_type
         self._ack_host = ack_host
+        # Fields shared by every ack from this viewer, laid out as ImageAck.to_dict
+        self._ack_template = {
+            MessageFields.TYPE: "image_ack",
+            MessageFields.VIEWER_PORT: port,
+            # Known viewers go out as a small int; ImageAck.from_dict decodes it
+            MessageFields.VIEWER_TYPE: ViewerType.encode(viewer_type),
+        }
         self.ack_socket = None
         self._setup_ack_socket()
 
@@ -65,33 +72,48 @@ class StreamingVisualizerServer(ZMQServer, ABC):
         """Send acknowledgment that an image was processed."""
         if not self.ack_socket:
             return
+        ack = self._ack_template | {
+            MessageFields.IMAGE_ID: image_id,
+            MessageFields.STATUS: status,
+            MessageFields.TIMESTAMP: time.time(),
+        }
+        if error is not None:
+            ack[MessageFields.ERROR] = error
         try:
-            ack = ImageAck(
-                image_id=image_id,
-                viewer_port=self.port,
-                viewer_type=self.viewer_type,
-                status=status,
-                timestamp=time.time(),
-                error=error,
-            )
-            self.ack_socket.send_json(ack.to_dict())
+            # Never stall display on a slow or absent ack listener
+            self.ack_socket.send(encode_data(ack), zmq.NOBLOCK)
+        except zmq.Again:
+            logger.debug("Ack queue full, dropped ack for %s", image_id)
         except Exception as e:
             logger.warning("Failed to send ack for %s: %s", image_id, e)
 
     def deserialize_message(self, message: bytes) -> dict:
         """Deserialize a raw message payload into a dict."""
-        return json.loads(message.decode("utf-8"))
+        # orjson when installed, with a stdlib fallback for what it rejects
+        return decode_json(message)
 
     def handle_data_message(self, message):
-        """Handle incoming image data messages by calling display_image."""
-        payload = message
+        """Handle incoming image data messages by calling display_image.
+
+        Accepts raw bytes or an already-decoded dict. Callers that know which
+        they hold can use handle_data_bytes or handle_data_dict directly.
+        """
         if isinstance(message, (bytes, bytearray)):
-            payload = self.deserialize_message(message)
-        if not isinstance(payload, dict):
-            return
+            self.handle_data_bytes(message)
+        elif isinstance(message, dict):
+            self.handle_data_dict(message)
+
+    def handle_data_bytes(self, raw: bytes):
+        """Deserialize a raw data frame and display its images."""
+        payload = self.deserialize_message(raw)
+        if isinstance(payload, dict):
+            self.handle_data_dict(payload)
 
-        if "images" in payload and isinstance(payload["images"], list):
-            for item in payload["images"]:
+    def handle_data_dict(self, payload: dict):
+        """Display the images in an already-decoded data payload."""
+        images = payload.get("images")
+        if isinstance(images, list):
+            for item in images:
                 if not isinstance(item, dict):
                     continue
                 image_data = item.get("data")
@@ -1,54 +1,143 @@
 """Transport utilities for ZMQ communication."""
 from __future__ import annotations
 
-import pickle
+import atexit
+import functools
+import os
 import platform
 import socket
+import struct
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
 import zmq
 
+from zmqruntime.codec import decode_control, encode_control_request
 from zmqruntime.config import TransportMode, ZMQConfig
 
 _default_config = ZMQConfig()
+# The platform never changes while the process runs
+_IS_WINDOWS = platform.system() == "Windows"
+# Windows doesn't support IPC (POSIX named pipes), so it defaults to TCP
+# Callers passing transport_mode=None get IPC on POSIX; keep it that way
+_DEFAULT_MODE = TransportMode.TCP if _IS_WINDOWS else TransportMode.IPC
+# SO_LINGER on with a zero timeout: close() resets instead of lingering
+# (struct linger holds u_shorts on Windows and ints elsewhere)
+_LINGER_ABORT = struct.pack("HH" if _IS_WINDOWS else "ii", 1, 0)
+# Every accepted spelling of a mode, so coercion is a dict lookup
+_MODE_LOOKUP: dict = {}
+for _mode in TransportMode:
+    _MODE_LOOKUP[_mode] = _mode
+    _MODE_LOOKUP[_mode.value] = _mode
+    _MODE_LOOKUP[_mode.value.upper()] = _mode
+del _mode
+# IPC directories already created by this process
+_created_ipc_dirs: set[Path] = set()
+# The ping request never changes, so it is encoded once
+_PING_BYTES = encode_control_request({"type": "ping"})
+
+
+_shared_ctx: zmq.Context | None = None
+_shared_ctx_lock = threading.Lock()
+
+
+def _get_shared_context() -> zmq.Context:
+    """Context shared by the probe helpers, created on first use.
+
+    Creating and terminating a context per ping starts and joins its IO
+    thread each time; readiness polling would do that dozens of times.
+    """
+    global _shared_ctx
+    if _shared_ctx is None:
+        with _shared_ctx_lock:
+            if _shared_ctx is None:
+                _shared_ctx = zmq.Context()
+    return _shared_ctx
+
+
+@atexit.register
+def _destroy_shared_context() -> None:
+    global _shared_ctx
+    if _shared_ctx is not None:
+        _shared_ctx.destroy(linger=0)
+        _shared_ctx = None
+
+
+def _forget_shared_context() -> None:
+    # A forked child must not use (or terminate) its parent's IO thread state
+    global _shared_ctx
+    _shared_ctx = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_context)
 
 
 def get_default_transport_mode() -> TransportMode:
-    """Get platform-appropriate transport mode."""
-    return TransportMode.TCP if platform.system() == "Windows" else TransportMode.IPC
+    """Get platform-appropriate transport mode.
+
+    IPC (Unix domain sockets) wherever it is available: local traffic then
+    skips the loopback TCP stack (checksums, ACKs, port allocation), which
+    cuts latency noticeably. TCP is only the default on Windows.
+    """
+    return _DEFAULT_MODE
 
 
 def coerce_transport_mode(transport_mode) -> TransportMode | None:
     """Normalize transport mode inputs to a zmqruntime TransportMode."""
     if transport_mode is None:
         return None
-    if isinstance(transport_mode, TransportMode):
-        return transport_mode
     try:
-        value = transport_mode.value
-    except Exception:
-        value = transport_mode
+        return _MODE_LOOKUP[transport_mode]
+    except (KeyError, TypeError):
+        pass
+    # Enum-likes from other packages (or their values, or anything whose str
+    # is a mode name)
+    value = getattr(transport_mode, "value", transport_mode)
     try:
-        return TransportMode(value)
-    except Exception:
-        try:
-            return TransportMode(str(value))
-        except Exception:
-            return None
+        mode = _MODE_LOOKUP.get(value)
+    except TypeError:
+        mode = None
+    return mode or _MODE_LOOKUP.get(str(value))
 
 
 def get_ipc_socket_path(port: int, config: ZMQConfig | None = None) -> Optional[Path]:
     """Get IPC socket path for a given port (Unix/Mac only)."""
-    config = config or _default_config
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return None
-    ipc_dir = Path.home() / f".{config.app_name}" / config.ipc_socket_dir
+    return _build_ipc_socket_path(port, config or _default_config)
+
+
+@functools.lru_cache(maxsize=None)
+def _ipc_dir(app_name: str, ipc_socket_dir: str) -> Path:
+    """Directory holding IPC sockets; Path.home() is resolved once per app."""
+    return Path.home() / f".{app_name}" / ipc_socket_dir
+
+
+@functools.lru_cache(maxsize=256)
+def _build_ipc_socket_path(port: int, config: ZMQConfig) -> Path:
+    # Readiness polling resolves the same path every few hundred ms; the Path
+    # joins only need doing once per (port, config).
+    ipc_dir = _ipc_dir(config.app_name, config.ipc_socket_dir)
     socket_name = f"{config.ipc_socket_prefix}-{port}{config.ipc_socket_extension}"
     return ipc_dir / socket_name
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve(host: str) -> str:
+    """IPv4 address for host, resolved once; probes then skip getaddrinfo."""
+    return socket.gethostbyname(host)
+
+
+def _ensure_ipc_dir(ipc_dir: Path) -> None:
+    # Every port shares one directory, so mkdir runs once per process
+    if ipc_dir not in _created_ipc_dirs:
+        ipc_dir.mkdir(parents=True, exist_ok=True)
+        _created_ipc_dirs.add(ipc_dir)
+
+
 def get_zmq_transport_url(
     port: int,
     host: str = "localhost",
@@ -58,8 +147,15 @@ def get_zmq_transport_url(
     """Get ZMQ transport URL for given port/host/mode."""
     config = config or _default_config
     mode = coerce_transport_mode(mode) or get_default_transport_mode()
+    return _build_transport_url(port, host, mode, config)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_transport_url(port: int, host: str, mode: TransportMode, config: ZMQConfig) -> str:
+    # ZMQConfig is frozen, so (port, host, mode, config) fully determines the URL
+    # and the IPC directory only needs creating on the first lookup.
     if mode == TransportMode.IPC:
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             raise ValueError(
                 "IPC transport mode is not supported on Windows. "
                 "Use TransportMode.TCP instead, or use get_default_transport_mode()."
@@ -67,7 +163,7 @@ def get_zmq_transport_url(
         socket_path = get_ipc_socket_path(port, config)
         if socket_path is None:
             raise ValueError("IPC socket path could not be determined.")
-        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_ipc_dir(socket_path.parent)
         return f"ipc://{socket_path}"
     if mode == TransportMode.TCP:
         return f"tcp://{host}:{port}"
@@ -88,22 +184,22 @@ def get_control_url(
 ) -> str:
     """Get control socket URL for a given data port."""
     config = config or _default_config
-    mode = coerce_transport_mode(transport_mode) or get_default_transport_mode()
-    return get_zmq_transport_url(
-        get_control_port(port, config),
-        host=host,
-        mode=mode,
-        config=config,
-    )
+    mode = coerce_transport_mode(transport_mode) or _DEFAULT_MODE
+    # Straight to the memoized builder: pings resolve this URL in a loop
+    return _build_transport_url(port + config.control_port_offset, host, mode, config)
 
 
 def remove_ipc_socket(port: int, config: ZMQConfig | None = None) -> bool:
     """Remove stale IPC socket file."""
     socket_path = get_ipc_socket_path(port, config)
-    if socket_path and socket_path.exists():
-        socket_path.unlink()
-        return True
-    return False
+    if not socket_path:
+        return False
+    # One unlink syscall instead of Path.exists() + Path.unlink()
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def is_port_in_use(
@@ -117,22 +213,19 @@ def is_port_in_use(
     mode = coerce_transport_mode(transport_mode) or get_default_transport_mode()
     if mode == TransportMode.IPC:
         socket_path = get_ipc_socket_path(port, config)
-        return socket_path.exists() if socket_path else False
+        return os.path.exists(socket_path) if socket_path else False
 
+    # Probe by connecting: it leaves the kernel bind table alone, and an
+    # abortive close (RST) keeps repeated probes from piling up in TIME_WAIT.
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(0.1)
     try:
-        sock.bind((host, port))
-        return False
+        sock.settimeout(0.1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_ABORT)
+        return sock.connect_ex((_resolve(host), port)) == 0
     except OSError:
-        return True
-    except Exception:
         return False
     finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
+        sock.close()
 
 
 def ping_control_port(
@@ -146,34 +239,23 @@ def ping_control_port(
     """Ping the control socket for a given data port."""
     config = config or _default_config
     control_url = get_control_url(port, transport_mode, host=host, config=config)
-    ctx = None
-    sock = None
     try:
-        ctx = zmq.Context()
-        sock = ctx.socket(zmq.REQ)
-        sock.setsockopt(zmq.LINGER, 0)
-        sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
-        sock.connect(control_url)
-        sock.send(pickle.dumps({"type": "ping"}))
-        response = pickle.loads(sock.recv())
-        if response.get("type") != "pong":
-            return False
-        if require_ready:
-            return bool(response.get("ready"))
-        return True
+        # zmq sockets close themselves on exiting the with block
+        with _get_shared_context().socket(zmq.REQ) as sock:
+            sock.setsockopt(zmq.LINGER, 0)
+            sock.connect(control_url)
+            sock.send(_PING_BYTES)
+            # Wait in poll, then take the queued reply without blocking
+            if not sock.poll(timeout_ms, zmq.POLLIN):
+                return False
+            response = decode_control(sock.recv(zmq.NOBLOCK))
+            if response.get("type") != "pong":
+                return False
+            if require_ready:
+                return bool(response.get("ready"))
+            return True
     except Exception:
         return False
-    finally:
-        if sock is not None:
-            try:
-                sock.close()
-            except Exception:
-                pass
-        if ctx is not None:
-            try:
-                ctx.term()
-            except Exception:
-                pass
 
 
 def wait_for_server_ready(
@@ -185,34 +267,44 @@ def wait_for_server_ready(
     require_ready: bool = True,
     poll_interval: float = 0.2,
 ) -> bool:
-    """Wait for a server to bind its data/control sockets and respond to ping."""
+    """Wait for a server to bind its data/control sockets and respond to ping.
+
+    A pong proves both sockets are bound, so the control socket is pinged
+    directly. One REQ socket is reused for every attempt, and the wait for a
+    reply backs off from 5 ms up to poll_interval.
+    """
     config = config or _default_config
-    start_time = time.time()
-    control_port = get_control_port(port, config)
-
-    while time.time() - start_time < timeout:
-        if is_port_in_use(port, transport_mode, host=host, config=config) and is_port_in_use(
-            control_port,
-            transport_mode,
-            host=host,
-            config=config,
-        ):
-            break
-        time.sleep(poll_interval)
-    else:
+    control_url = get_control_url(port, transport_mode, host=host, config=config)
+    deadline = time.monotonic() + timeout
+    max_wait_ms = max(5, int(poll_interval * 1000))
+    wait_ms = 5
+    sock = _get_shared_context().socket(zmq.REQ)
+    try:
+        sock.setsockopt(zmq.LINGER, 0)
+        # Allow a new ping while the last is unanswered, and drop late pongs
+        sock.setsockopt(zmq.REQ_RELAXED, 1)
+        sock.setsockopt(zmq.REQ_CORRELATE, 1)
+        # Notice the server binding well within the first backoff steps
+        sock.setsockopt(zmq.RECONNECT_IVL, 5)
+        sock.connect(control_url)
+        poller = zmq.Poller()
+        poller.register(sock, zmq.POLLIN)
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return False
+            sock.send(_PING_BYTES)
+            if poller.poll(min(wait_ms, remaining_ms)):
+                try:
+                    response = decode_control(sock.recv())
+                except Exception:
+                    response = {}
+                if response.get("type") == "pong" and (not require_ready or response.get("ready")):
+                    return True
+                # Answered but not ready yet; give it a moment before asking again
+                time.sleep(min(wait_ms, remaining_ms) / 1000)
+            wait_ms = min(wait_ms * 2, max_wait_ms)
+    except zmq.ZMQError:
         return False
-
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if ping_control_port(
-            port,
-            transport_mode,
-            host=host,
-            config=config,
-            timeout_ms=1000,
-            require_ready=require_ready,
-        ):
-            return True
-        time.sleep(0.5)
-
-    return False
+    finally:
+        sock.close()
@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+from zmqruntime.client import PopenHandle, wrap_server_process
+
+
+def test_popen_handle_stop():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    handle = wrap_server_process(process)
+    assert isinstance(handle, PopenHandle)
+    assert handle.alive()
+    handle.stop(timeout=5)
+    assert not handle.alive()
+    assert wrap_server_process(handle) is handle
+    assert wrap_server_process(None) is None
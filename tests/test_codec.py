@@ -0,0 +1,70 @@
+import math
+import pickle
+
+import pytest
+
+from zmqruntime.codec import (
+    decode_control,
+    decode_control_request,
+    decode_data,
+    decode_json,
+    encode_control,
+    encode_control_request,
+    encode_data,
+    encode_json,
+)
+from zmqruntime.messages import ControlMessageType, MessageFields
+
+
+def test_control_roundtrip():
+    message = {MessageFields.TYPE: ControlMessageType.PING.value}
+    data = encode_control(message)
+    assert data[0] != 0x80
+    assert decode_control(data) == message
+
+
+def test_empty_message_roundtrip():
+    assert decode_control(encode_control({})) == {}
+
+
+def test_decode_legacy_pickle():
+    message = {MessageFields.TYPE: "pong", MessageFields.READY: True}
+    assert decode_control(pickle.dumps(message)) == message
+
+
+def test_control_requests_never_unpickle():
+    message = {MessageFields.TYPE: ControlMessageType.PING.value}
+    assert decode_control_request(encode_control_request(message)) == message
+    with pytest.raises(ValueError):
+        decode_control_request(pickle.dumps(message))
+
+
+def test_encode_falls_back_to_pickle_for_objects():
+    message = {MessageFields.TYPE: "ok", "payload": {1, 2}}
+    data = encode_control(message)
+    assert decode_control(data) == message
+
+
+def test_requests_that_need_pickle_fail_on_the_client():
+    message = {MessageFields.TYPE: "execute", "payload": {1, 2}}
+    with pytest.raises(TypeError):
+        encode_control_request(message)
+
+
+def test_data_roundtrip_and_legacy_json():
+    message = {MessageFields.TYPE: "image_ack", MessageFields.IMAGE_ID: "img-1"}
+    assert decode_data(encode_data(message)) == message
+    assert decode_data(b'{"type": "image_ack", "image_id": "img-1"}') == message
+
+
+def test_encode_json_round_trips_through_decode_data():
+    message = {"type": "progress", "well_id": "A01", "step": "load", "timestamp": 1.5}
+    encoded = encode_json(message)
+    assert isinstance(encoded, bytes)
+    assert decode_data(memoryview(encoded)) == message
+
+
+def test_decode_json_accepts_stdlib_only_values():
+    decoded = decode_json(b'{"data": NaN, "big": 123456789012345678901234567890}')
+    assert math.isnan(decoded["data"])
+    assert decoded["big"] == 123456789012345678901234567890
@@ -15,3 +15,12 @@ def test_zmq_config_defaults():
     assert config.ipc_socket_extension == ".sock"
     assert config.shared_ack_port == 7555
     assert config.app_name == "zmqruntime"
+    assert config.ack_poll_interval_ms == 1000
+    assert config.progress_poll_interval_ms == 100
+    assert config.scan_timeout_ms == 200
+    assert config.ctrl_request_timeout_ms == 5000
+
+
+def test_zmq_config_is_hashable():
+    assert hash(ZMQConfig()) == hash(ZMQConfig())
+    assert ZMQConfig(app_name="a") != ZMQConfig(app_name="b")
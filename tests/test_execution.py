@@ -1,3 +1,10 @@
+import pickle
+import threading
+import time
+
+import zmq
+
+from zmqruntime.codec import decode_control, encode_control_request
 from zmqruntime.execution.client import ExecutionClient
 from zmqruntime.execution.server import ExecutionServer
 from zmqruntime.messages import ControlMessageType, ExecuteRequest, ExecutionStatus, MessageFields
@@ -19,10 +26,132 @@ def test_execution_server_handle_execute_and_run():
     assert response[MessageFields.STATUS] == "accepted"
     execution_id = response[MessageFields.EXECUTION_ID]
     record = server.active_executions[execution_id]
-    assert record[MessageFields.STATUS] == ExecutionStatus.QUEUED.value
+    assert record.status == ExecutionStatus.QUEUED.value
 
     server._run_execution(execution_id, request, record)
-    assert record[MessageFields.STATUS] == ExecutionStatus.COMPLETE.value
+    assert record.status == ExecutionStatus.COMPLETE.value
+
+
+def test_execution_server_pong_tracks_state_changes():
+    server = DummyExecutionServer(port=5555)
+    # Live execution state must never be served from the static pong cache
+    assert server._pong_cacheable is False
+    assert server._create_pong_response()[MessageFields.ACTIVE_EXECUTIONS] == 0
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    execution_id = server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID]
+    assert server._create_pong_response()[MessageFields.ACTIVE_EXECUTIONS] == 1
+
+    server._run_execution(execution_id, request, server.active_executions[execution_id])
+    pong = server._create_pong_response()
+    assert pong[MessageFields.ACTIVE_EXECUTIONS] == 0
+    assert pong[MessageFields.RUNNING_EXECUTIONS] == []
+
+
+def test_execution_server_trims_finished_history():
+    server = DummyExecutionServer(port=5555)
+    server.max_execution_history = 2
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    execution_ids = []
+    for _ in range(3):
+        execution_id = server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID]
+        server._run_execution(execution_id, request, server.active_executions[execution_id])
+        execution_ids.append(execution_id)
+    assert list(server.active_executions) == execution_ids[1:]
+
+
+class CancelledMidRunServer(ExecutionServer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status_events = []
+
+    def execute_task(self, execution_id: str, request: ExecuteRequest):
+        # A cancel lands while the task is running; the task still returns
+        self._handle_cancel({MessageFields.EXECUTION_ID: execution_id})
+        return {"result": 1}
+
+    def send_status_update(self, execution_id, status):
+        self.status_events.append((execution_id, status))
+
+
+def test_execution_server_publishes_one_terminal_event_per_execution():
+    server = CancelledMidRunServer(port=5555)
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    execution_id = server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID]
+    server._run_execution(execution_id, request, server.active_executions[execution_id])
+    assert server.status_events == [(execution_id, ExecutionStatus.CANCELLED.value)]
+    assert server.active_executions[execution_id].status == ExecutionStatus.CANCELLED.value
+
+
+class _ReplySocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, payload, copy=True):
+        self.sent.append(decode_control(payload))
+
+
+def test_execution_server_replies_to_malformed_control_frames():
+    server = DummyExecutionServer(port=5555)
+    sock = _ReplySocket()
+    server._reply_to_control_request(sock, [zmq.Frame(b"\xc1garbage")])
+    assert sock.sent[-1]["status"] == "error"
+    # Pickled requests are refused rather than unpickled
+    server._reply_to_control_request(sock, [zmq.Frame(pickle.dumps({"type": "ping"}))])
+    assert sock.sent[-1]["status"] == "error"
+    # The same socket keeps answering afterwards
+    server._reply_to_control_request(sock, [zmq.Frame(encode_control_request({"type": "ping"}))])
+    assert sock.sent[-1]["type"] == "pong"
+
+
+class BarrierExecutionServer(ExecutionServer):
+    max_concurrent_executions = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def execute_task(self, execution_id: str, request: ExecuteRequest):
+        # Only passes when both executions are running at the same time
+        self.barrier.wait()
+        return {}
+
+
+def test_execution_server_runs_executions_concurrently():
+    server = BarrierExecutionServer(port=5555)
+    server._start_queue_worker()
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    execution_ids = [server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID] for _ in range(2)]
+    server.execution_queue.join()
+    server._stop_queue_worker()
+    for execution_id in execution_ids:
+        assert server.active_executions[execution_id].status == ExecutionStatus.COMPLETE.value
+
+
+def test_execution_server_cancel_is_scoped_when_concurrent():
+    server = BarrierExecutionServer(port=5555)
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    first, second = (server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID] for _ in range(2))
+    response = server._handle_cancel({MessageFields.EXECUTION_ID: first})
+    assert response[MessageFields.WORKERS_KILLED] == 0
+    assert server.active_executions[first].status == ExecutionStatus.CANCELLED.value
+    assert server.active_executions[second].status == ExecutionStatus.QUEUED.value
+
+
+def test_execution_server_restart_after_repeated_shutdown_requests():
+    server = DummyExecutionServer(port=5555)
+    server._start_queue_worker()
+    # request_shutdown() followed by stop() signals the workers twice
+    server._stop_queue_worker()
+    server._stop_queue_worker()
+    for worker in server._queue_workers:
+        worker.join(timeout=5)
+    server._shutdown.clear()
+    server._start_queue_worker()
+    request = ExecuteRequest(plate_id="plate-1", pipeline_code="pass", config_params={})
+    execution_id = server._handle_execute(request.to_dict())[MessageFields.EXECUTION_ID]
+    server.execution_queue.join()
+    server._stop_queue_worker()
+    assert server.active_executions[execution_id].status == ExecutionStatus.COMPLETE.value
 
 
 class DummyExecutionClient(ExecutionClient):
@@ -51,3 +180,45 @@ def test_execution_client_submit_adds_type():
     client = DummyExecutionClient()
     response = client.submit_execution({"hello": "world"})
     assert response[MessageFields.TYPE] == ControlMessageType.EXECUTE.value
+
+
+class FailedStatusClient(DummyExecutionClient):
+    def poll_status(self, execution_id=None):
+        return {
+            MessageFields.STATUS: "ok",
+            "execution": {MessageFields.STATUS: ExecutionStatus.FAILED.value, MessageFields.ERROR: "boom"},
+        }
+
+
+def test_execution_client_wait_for_completion_failed():
+    client = FailedStatusClient()
+    result = client.wait_for_completion("exec-1", poll_interval=0)
+    assert result[MessageFields.STATUS] == ExecutionStatus.FAILED.value
+    assert result[MessageFields.MESSAGE] == "boom"
+
+
+class SlowStatusClient(DummyExecutionClient):
+    def __init__(self):
+        super().__init__()
+        self.sent = 0
+
+    def _send_control_request(self, request, timeout_ms=5000):
+        self.sent += 1
+        time.sleep(0.2)
+        return {MessageFields.STATUS: "ok"}
+
+
+def test_execution_client_coalesces_concurrent_status_polls():
+    client = SlowStatusClient()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.poll_status("exec-1")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.sent == 1
+    assert results == [{MessageFields.STATUS: "ok"}] * 4
+    assert client._pending == {}
@@ -1,9 +1,14 @@
+import pytest
+
 from zmqruntime.messages import (
     CancelRequest,
     ExecuteRequest,
+    ExecutionRecord,
+    ImageAck,
     MessageFields,
     PongResponse,
     ResponseType,
+    ViewerType,
 )
 
 
@@ -34,3 +39,49 @@ def test_pong_response_dict():
     data = pong.to_dict()
     assert data[MessageFields.TYPE] == ResponseType.PONG.value
     assert data[MessageFields.PORT] == 5555
+
+
+def test_execute_request_payload_frames_not_serialized():
+    frames = [b"\x00\x01"]
+    request = ExecuteRequest.from_dict(
+        {
+            MessageFields.PLATE_ID: "plate-1",
+            MessageFields.PIPELINE_CODE: "print('hi')",
+            MessageFields.PAYLOAD_FRAMES: frames,
+        }
+    )
+    assert request.payload_frames == frames
+    assert MessageFields.PAYLOAD_FRAMES not in request.to_dict()
+
+
+def test_message_dataclasses_are_slotted():
+    pong = PongResponse(port=1, control_port=2, ready=True, server="s")
+    assert not hasattr(pong, "__dict__")
+
+
+def test_execution_record_dict_access():
+    record = ExecutionRecord(execution_id="exec-1", plate_id="plate-1")
+    record[MessageFields.ERROR] = "boom"
+    assert record.error == "boom"
+    assert record[MessageFields.STATUS] == "queued"
+    # The server indexes records by status, so it cannot be set behind its back
+    with pytest.raises(TypeError):
+        record[MessageFields.STATUS] = "running"
+    with pytest.raises(TypeError):
+        record.pop(MessageFields.STATUS)
+    assert record.pop(MessageFields.ERROR) == "boom"
+    assert record.get(MessageFields.ERROR) is None
+    assert record.to_dict()[MessageFields.PLATE_ID] == "plate-1"
+    assert "orchestrator" not in record.to_dict()
+
+
+def test_image_ack_decodes_viewer_type_codes():
+    data = {
+        MessageFields.IMAGE_ID: "img-1",
+        MessageFields.VIEWER_PORT: 5555,
+        MessageFields.VIEWER_TYPE: ViewerType.encode("napari"),
+    }
+    assert data[MessageFields.VIEWER_TYPE] == 0
+    assert ImageAck.from_dict(data).viewer_type == "napari"
+    data[MessageFields.VIEWER_TYPE] = ViewerType.encode("custom")
+    assert ImageAck.from_dict(data).viewer_type == "custom"
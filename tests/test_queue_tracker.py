@@ -1,6 +1,6 @@
 import time
 
-from zmqruntime.queue_tracker import QueueTracker, GlobalQueueTrackerRegistry
+from zmqruntime.queue_tracker import GLOBAL_QUEUE_TRACKER_REGISTRY, GlobalQueueTrackerRegistry, QueueTracker
 
 
 def test_queue_tracker_progress():
@@ -15,9 +15,36 @@ def test_queue_tracker_progress():
     assert tracker.has_stuck_images() is True
 
 
+
+def test_queue_tracker_stuck_images_skip_acked():
+    tracker = QueueTracker(viewer_port=5555, viewer_type="test", timeout_seconds=0.01)
+    tracker.register_sent("img-1")
+    tracker.register_sent("img-2")
+    time.sleep(0.02)
+    tracker.register_sent("img-3")
+    tracker.mark_processed("img-1")
+    assert [image_id for image_id, _ in tracker.get_stuck_images()] == ["img-2"]
+    # Reporting stuck images must not forget them
+    assert tracker.has_stuck_images() is True
+    tracker.mark_processed("img-2")
+    assert tracker.has_stuck_images() is False
+
 def test_global_registry():
-    registry = GlobalQueueTrackerRegistry()
+    registry = GLOBAL_QUEUE_TRACKER_REGISTRY
+    # Code that still calls the class must reach the instance acks are routed to
+    assert GlobalQueueTrackerRegistry() is registry
     tracker = registry.get_or_create_tracker(1234, "test")
     assert registry.get_tracker(1234) is tracker
     registry.remove_tracker(1234)
     assert registry.get_tracker(1234) is None
+
+
+def test_global_registry_lists_trackers_across_shards():
+    registry = GLOBAL_QUEUE_TRACKER_REGISTRY
+    ports = range(7000, 7000 + 2 * registry._shard_count)
+    for port in ports:
+        registry.get_or_create_tracker(port, "test")
+    assert set(ports) <= set(registry.get_all_trackers())
+    for port in ports:
+        registry.remove_tracker(port)
+    assert not set(ports) & set(registry.get_all_trackers())
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import zmq
+
+from zmqruntime.client import ZMQClient
+from zmqruntime.config import TransportMode, ZMQConfig
+from zmqruntime.messages import ControlMessageType, MessageFields, ResponseType
+from zmqruntime.server import ZMQServer
+
+
+class PubServer(ZMQServer):
+    def __init__(self, port, config):
+        super().__init__(port, transport_mode=TransportMode.TCP, data_socket_type=zmq.PUB, config=config)
+
+    def handle_control_message(self, message):
+        return {}
+
+    def handle_data_message(self, message):
+        pass
+
+
+class PubClient(ZMQClient):
+    def _spawn_server_process(self):
+        return None
+
+    def send_data(self, data):
+        pass
+
+
+def test_pub_server_declines_subscription_handshake():
+    server = PubServer(17811, ZMQConfig())
+    response = server._create_subscription_ack(
+        {MessageFields.TYPE: ControlMessageType.AWAIT_SUBSCRIPTION.value, MessageFields.TOKEN: "t"}
+    )
+    assert response[MessageFields.TYPE] != ResponseType.SUBSCRIPTION_ACK.value
+
+
+def _serve(server):
+    server.start()
+    loop = threading.Thread(
+        target=lambda: [server.process_messages() or time.sleep(0.001) for _ in iter(server.is_running, False)],
+        daemon=True,
+    )
+    loop.start()
+    return loop
+
+
+def test_client_falls_back_to_fixed_delay_for_pub_server():
+    config = ZMQConfig()
+    server = PubServer(17811, config)
+    loop = _serve(server)
+    client = PubClient(17811, transport_mode=TransportMode.TCP, config=config)
+    try:
+        started = time.monotonic()
+        client._setup_client_sockets()
+        # One declined handshake plus the 100 ms delay, not a 1 s polling loop
+        assert time.monotonic() - started < 0.5
+    finally:
+        client._cleanup_sockets()
+        server.stop()
+        loop.join(timeout=2)
+
+
+def test_scan_servers_accepts_a_generator():
+    config = ZMQConfig()
+    server = PubServer(17812, config)
+    loop = _serve(server)
+    try:
+        found = ZMQClient.scan_servers(
+            (port for port in (17812, 17813)), transport_mode=TransportMode.TCP, config=config
+        )
+        assert [pong["port"] for pong in found] == [17812]
+    finally:
+        server.stop()
+        loop.join(timeout=2)
@@ -1,11 +1,13 @@
 import os
 import platform
+from enum import Enum
 from pathlib import Path
 
 import pytest
 
 from zmqruntime.config import TransportMode, ZMQConfig
 from zmqruntime.transport import (
+    coerce_transport_mode,
     get_default_transport_mode,
     get_ipc_socket_path,
     get_zmq_transport_url,
@@ -18,6 +20,18 @@ def test_get_default_transport_mode():
     assert mode in (TransportMode.TCP, TransportMode.IPC)
 
 
+def test_coerce_transport_mode():
+    class ForeignMode(Enum):
+        IPC = "ipc"
+
+    assert coerce_transport_mode(TransportMode.TCP) is TransportMode.TCP
+    assert coerce_transport_mode("tcp") is TransportMode.TCP
+    assert coerce_transport_mode(ForeignMode.IPC) is TransportMode.IPC
+    assert coerce_transport_mode(None) is None
+    assert coerce_transport_mode("bogus") is None
+    assert coerce_transport_mode(["tcp"]) is None
+
+
 def test_get_zmq_transport_url_tcp():
     url = get_zmq_transport_url(5555, host="localhost", mode=TransportMode.TCP)
     assert url == "tcp://localhost:5555"